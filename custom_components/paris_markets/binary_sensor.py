@@ -3,25 +3,62 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+import time
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+from datetime import time as dt_time
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
-from zoneinfo import ZoneInfo
 
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DEFAULT_ICON, DOMAIN
+from .const import ATTRIBUTION, DEFAULT_ICON, DOMAIN, PARIS_TZ
 from .coordinator import ParisMarketsDataUpdateCoordinator
-from .models import MarketData, WeekDay
+from .models import MarketData
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared by every market sensor, the per-market name comes from the
+# translation placeholders
+ENTITY_DESCRIPTION = BinarySensorEntityDescription(
+    key="market",
+    icon=DEFAULT_ICON,
+    translation_key="market",
+)
+
+
+def _seconds_since_midnight(moment: dt_time) -> int:
+    """Return the wall-clock time of day as whole seconds since midnight."""
+    return moment.hour * 3600 + moment.minute * 60 + moment.second
+
+
+@lru_cache(maxsize=2)
+def _paris_utc_offset(utc_hour: int) -> int:
+    """Return the Paris UTC offset in seconds during a given UTC hour.
+
+    DST transitions happen on the hour, so the offset is constant per hour.
+    """
+    utc_offset = datetime.fromtimestamp(utc_hour * 3600, PARIS_TZ).utcoffset()
+    return int(utc_offset.total_seconds())  # type: ignore[union-attr]
+
+
+def _paris_now() -> tuple[int, int]:
+    """Return the current Paris weekday (0=Monday) and seconds since midnight."""
+    timestamp = int(time.time())
+    local_timestamp = timestamp + _paris_utc_offset(timestamp // 3600)
+    # The Unix epoch fell on a Thursday
+    return (local_timestamp // 86400 + 3) % 7, local_timestamp % 86400
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -31,10 +68,16 @@ async def async_setup_entry(
     """Set up the Paris Markets binary sensors."""
     coordinator: ParisMarketsDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
-    if coordinator.data:
-        for market_id in coordinator.data.keys():
-            entities.append(MarketBinarySensor(coordinator, market_id))
+    # Markets that never open would always be off, don't register them
+    entities = (
+        [
+            MarketBinarySensor(coordinator, market_id)
+            for market_id, market_data in coordinator.data.items()
+            if market_data.has_open_days()
+        ]
+        if coordinator.data
+        else []
+    )
 
     async_add_entities(entities, True)
 
@@ -46,6 +89,7 @@ class MarketBinarySensor(
 
     _attr_attribution = ATTRIBUTION
     _attr_has_entity_name = True
+    entity_description = ENTITY_DESCRIPTION
 
     def __init__(
         self,
@@ -56,75 +100,141 @@ class MarketBinarySensor(
         super().__init__(coordinator)
         self.market_id = market_id
         self._market_data = self._get_market_data()
+        self._schedule_table = self._build_schedule_table()
+        self._attributes = self._build_attributes()
+        self._unsub_state_change: CALLBACK_TYPE | None = None
 
         if not self._market_data:
-            market_name = f"Market {self.market_id}"
             short_name = self.market_id
         else:
-            market_name = self._market_data.long_name
             short_name = self._market_data.short_name
 
         self._attr_translation_placeholders = {"market_name": short_name}
-        self.entity_description = BinarySensorEntityDescription(
-            key=f"market_{self.market_id}",
-            name=market_name,
-            icon=DEFAULT_ICON,
-            translation_key="market",
-        )
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{self.market_id}"
 
     def _get_market_data(self) -> MarketData | None:
         """Get data for the current market."""
-        return MarketData.from_coordinator(self.coordinator, self.market_id)
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if the market is open."""
-        market_data = self._get_market_data()
-        if not market_data:
+        if self.coordinator.data is None:
             return None
+        return self.coordinator.data.get(self.market_id)
 
-        paris_now = datetime.now(tz=ZoneInfo("Europe/Paris"))
-        paris_time = paris_now.time()
-        current_weekday = WeekDay.from_date(paris_now.date())
+    def _build_schedule_table(self) -> tuple[tuple[int, int] | None, ...]:
+        """Build Paris opening hours in seconds since midnight, indexed by weekday.
 
-        market_day_schedule = market_data.schedule[current_weekday]
+        Index 0 is Monday, closed days are None.
+        """
+        if not self._market_data:
+            return ()
+
+        return tuple(
+            (
+                _seconds_since_midnight(day.start_time),  # type: ignore[arg-type]
+                _seconds_since_midnight(day.end_time),  # type: ignore[arg-type]
+            )
+            if day.is_open()
+            else None
+            for day in self._market_data.schedule[1:]
+        )
 
-        if not market_day_schedule.is_open():
-            return False
+    def _build_attributes(self) -> Mapping[str, Any] | None:
+        """Build the read-only state attributes for the market."""
+        market_data = self._market_data
+        if not market_data:
+            return None
 
-        start_time = market_day_schedule.start_time
-        end_time = market_day_schedule.end_time
+        coordinates = market_data.coordinates or {}
+        return MappingProxyType(
+            {
+                "long_name": market_data.long_name,
+                "short_name": market_data.short_name,
+                "arrondissement": market_data.arrondissement,
+                "location": market_data.location,
+                "product_type": market_data.product_type,
+                ATTR_LATITUDE: coordinates.get("lat"),
+                ATTR_LONGITUDE: coordinates.get("lon"),
+            }
+        )
 
-        if not start_time or not end_time:
-            return False
+    @property
+    def is_on(self) -> bool | None:
+        """Return True if the market is open."""
+        if not self._market_data:
+            return None
 
-        is_open_now = (
-            start_time.replace(tzinfo=None)
-            <= paris_time
-            <= end_time.replace(tzinfo=None)
-        )
+        weekday, now_seconds = _paris_now()
+        opening_hours = self._schedule_table[weekday]
+        if opening_hours is None:
+            return False
 
-        return is_open_now
+        start_seconds, end_seconds = opening_hours
+        return start_seconds <= now_seconds <= end_seconds
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def extra_state_attributes(self) -> Mapping[str, Any] | None:
         """Return other details about the market."""
-        market_data = self._get_market_data()
-        if not market_data:
+        return self._attributes
+
+    def _next_state_change(self) -> datetime | None:
+        """Return when the market next opens or closes, None if it never does."""
+        if not any(self._schedule_table):
             return None
 
-        return {
-            "long_name": market_data.long_name,
-            "short_name": market_data.short_name,
-            "arrondissement": market_data.arrondissement,
-            "location": market_data.location,
-            "product_type": market_data.product_type,
-            "coordinates": market_data.coordinates,
-        }
+        now = datetime.fromtimestamp(time.time(), PARIS_TZ)
+        midnight = datetime.combine(now.date(), dt_time(), PARIS_TZ)
+        # Eight days so that today's weekday is checked again next week
+        for day_offset in range(8):
+            opening_hours = self._schedule_table[(now.weekday() + day_offset) % 7]
+            if opening_hours is None:
+                continue
+            day_start = midnight + timedelta(days=day_offset)
+            start_seconds, end_seconds = opening_hours
+            # The closing second still counts as open, so it closes a second later
+            for boundary_seconds in (start_seconds, end_seconds + 1):
+                boundary = day_start + timedelta(seconds=boundary_seconds)
+                if boundary > now:
+                    return boundary
+
+        return None
+
+    async def async_added_to_hass(self) -> None:
+        """Track the schedule once the sensor is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_state_change)
+        self._async_schedule_state_change()
+
+    @callback
+    def _async_schedule_state_change(self) -> None:
+        """Schedule a state write for the next opening or closing."""
+        self._async_cancel_state_change()
+        if (next_change := self._next_state_change()) is not None:
+            self._unsub_state_change = async_track_point_in_utc_time(
+                self.hass, self._async_state_changed, next_change
+            )
+
+    @callback
+    def _async_cancel_state_change(self) -> None:
+        """Cancel the scheduled state write, if any."""
+        if self._unsub_state_change is not None:
+            self._unsub_state_change()
+            self._unsub_state_change = None
+
+    @callback
+    def _async_state_changed(self, _now: datetime) -> None:
+        """Write the state the market just switched to."""
+        self._unsub_state_change = None
+        self.async_write_ha_state()
+        self._async_schedule_state_change()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._market_data = self._get_market_data()
+        market_data = self._get_market_data()
+        # Each refresh builds new models, compare by value so that markets
+        # whose data did not change keep their derived state
+        if market_data != self._market_data:
+            self._market_data = market_data
+            self._schedule_table = self._build_schedule_table()
+            self._attributes = self._build_attributes()
+            if self.hass is not None:
+                self._async_schedule_state_change()
         self.async_write_ha_state()
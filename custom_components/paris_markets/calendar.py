@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta, date
+from datetime import date, datetime, tzinfo
 
 from homeassistant.components.calendar import (
     CalendarEntity,
@@ -14,17 +14,39 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from .const import (
     ATTRIBUTION,
     DEFAULT_ICON,
     DOMAIN,
+    PARIS_TZ,
 )
 from .coordinator import ParisMarketsDataUpdateCoordinator
-from .models import MarketData, WeekDay
+from .models import MarketData
 
 _LOGGER = logging.getLogger(__name__)
 
+# Bound on cached events per calendar, about a year of daily markets
+EVENT_CACHE_SIZE = 400
+
+# Weekday bitmask covering a full week (bit 0 is Monday)
+ALL_WEEKDAYS_MASK = 0b1111111
+
+# Shared by every market calendar, the per-market name comes from the
+# translation placeholders
+ENTITY_DESCRIPTION = CalendarEntityDescription(
+    key="market_calendar",
+    icon=DEFAULT_ICON,
+    translation_key="market",
+)
+
+
+def _ordinal_weekday(ordinal: int) -> int:
+    """Return the weekday (0=Monday) of a proleptic Gregorian ordinal."""
+    # Ordinal 1 is Monday 1 January of year 1
+    return (ordinal - 1) % 7
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -34,10 +56,11 @@ async def async_setup_entry(
     """Set up the Paris Markets calendar entities."""
     coordinator: ParisMarketsDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
-    if coordinator.data:
-        for market_id in coordinator.data.keys():
-            entities.append(MarketCalendar(coordinator, market_id))
+    entities = (
+        [MarketCalendar(coordinator, market_id) for market_id in coordinator.data]
+        if coordinator.data
+        else []
+    )
 
     async_add_entities(entities, True)
 
@@ -49,6 +72,7 @@ class MarketCalendar(
 
     _attr_attribution = ATTRIBUTION
     _attr_has_entity_name = True
+    entity_description = ENTITY_DESCRIPTION
 
     def __init__(
         self,
@@ -59,6 +83,8 @@ class MarketCalendar(
         super().__init__(coordinator)
         self.market_id = market_id
         self._market_data = self._get_market_data()
+        self._description = self._build_description(self._market_data)
+        self._event_cache: dict[tuple[int, tzinfo], CalendarEvent] = {}
 
         if not self._market_data:
             market_name = f"Market {self.market_id}"
@@ -71,40 +97,46 @@ class MarketCalendar(
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}_{self.market_id}_calendar"
         )
-        self.entity_description = CalendarEntityDescription(
-            key=f"market_{self.market_id}_calendar",
-            name=market_name,
-            icon=DEFAULT_ICON,
-            translation_key="market",
-        )
 
     def _get_market_data(self) -> MarketData | None:
         """Get data for the current market."""
-        return MarketData.from_coordinator(self.coordinator, self.market_id)
+        if self.coordinator.data is None:
+            return None
+        return self.coordinator.data.get(self.market_id)
+
+    @classmethod
+    def _build_description(cls, market_data: MarketData | None) -> str | None:
+        """Build the description shared by all events of a market."""
+        if not market_data:
+            return None
+        return cls._event_description(market_data)
 
     @property
     def event(self) -> CalendarEvent | None:
-        """Return the next upcoming event."""
-        return None
-
-    def _create_calendar_event(
-        self, market_data: MarketData, current_date: date
-    ) -> CalendarEvent | None:
-        """Create a calendar event for a given date if market is open."""
-        market_day_schedule = market_data.schedule[WeekDay.from_date(current_date)]
-
-        if not market_day_schedule.is_open():
+        """Return the current or next upcoming event."""
+        market_data = self._market_data
+        if not market_data:
             return None
 
-        local_schedule = market_day_schedule.as_local_datetimes(current_date)
-        if local_schedule is None:
-            raise ValueError(
-                f"Market {market_data.long_name} has no valid schedule for {current_date}"
-            )
+        now = dt_util.now()
+        # Schedules are expressed in Paris time, so scan Paris dates
+        today_ordinal = now.astimezone(PARIS_TZ).date().toordinal()
+        local_tz = dt_util.get_default_time_zone()
+
+        # Eight days so that today's weekday is checked again next week
+        for ordinal in range(today_ordinal, today_ordinal + 8):
+            if not market_data.open_mask >> _ordinal_weekday(ordinal) & 1:
+                continue
+            event = self._get_calendar_event(market_data, ordinal, local_tz)
+            if event is not None and event.end > now:
+                return event
 
-        local_start, local_end = local_schedule
+        return None
 
-        description = "\n".join(
+    @staticmethod
+    def _event_description(market_data: MarketData) -> str:
+        """Build the event description for a market."""
+        return "\n".join(
             [
                 f"Location: {market_data.location}",
                 f"Arrondissement: {market_data.arrondissement}",
@@ -112,6 +144,26 @@ class MarketCalendar(
             ]
         )
 
+    def _create_calendar_event(
+        self,
+        market_data: MarketData,
+        current_date: date,
+        description: str | None = None,
+        local_tz: tzinfo | None = None,
+    ) -> CalendarEvent | None:
+        """Create a calendar event for a given date if market is open."""
+        market_day_schedule = market_data.schedule[current_date.isoweekday()]
+
+        if not market_day_schedule.is_open():
+            return None
+
+        local_start, local_end = market_day_schedule.as_local_datetimes(
+            current_date, local_tz
+        )
+
+        if description is None:
+            description = self._event_description(market_data)
+
         return CalendarEvent(
             start=local_start,
             end=local_end,
@@ -121,6 +173,28 @@ class MarketCalendar(
             uid=f"{self.market_id}_{current_date.isoformat()}",
         )
 
+    def _get_calendar_event(
+        self,
+        market_data: MarketData,
+        ordinal: int,
+        local_tz: tzinfo,
+    ) -> CalendarEvent | None:
+        """Return the event for a date ordinal, reusing events built since the last update.
+
+        The date object is only built when the event is not cached yet.
+        """
+        cache_key = (ordinal, local_tz)
+        if (event := self._event_cache.get(cache_key)) is None:
+            event = self._create_calendar_event(
+                market_data, date.fromordinal(ordinal), self._description, local_tz
+            )
+            if event is None:
+                return None
+            if len(self._event_cache) >= EVENT_CACHE_SIZE:
+                self._event_cache.clear()
+            self._event_cache[cache_key] = event
+        return event
+
     async def async_get_events(
         self,
         hass: HomeAssistant,
@@ -128,23 +202,53 @@ class MarketCalendar(
         end_date: datetime,
     ) -> list[CalendarEvent]:
         """Return calendar events within a datetime range."""
-        market_data = self._get_market_data()
+        market_data = self._market_data
         if not market_data:
             return []
 
-        events = []
-        current_date = start_date.date()
-        final_date = end_date.date()
+        first_ordinal = start_date.date().toordinal()
+        last_ordinal = end_date.date().toordinal()
+
+        # Skip the loop when the range covers none of the market's open weekdays
+        if last_ordinal - first_ordinal >= 6:
+            range_mask = ALL_WEEKDAYS_MASK
+        else:
+            range_mask = sum(
+                1 << _ordinal_weekday(ordinal)
+                for ordinal in range(first_ordinal, last_ordinal + 1)
+            )
+        if not market_data.open_mask & range_mask:
+            return []
 
-        while current_date <= final_date:
-            if event := self._create_calendar_event(market_data, current_date):
-                events.append(event)
-            current_date += timedelta(days=1)
+        first_weekday = _ordinal_weekday(first_ordinal)
+
+        # Offsets of the open days within each week, relative to the first date
+        open_offsets = sorted(
+            (weekday - first_weekday) % 7
+            for weekday in range(7)
+            if market_data.open_mask >> weekday & 1
+        )
+        local_tz = dt_util.get_default_time_zone()
+
+        events = []
+        for week_ordinal in range(first_ordinal, last_ordinal + 1, 7):
+            for open_offset in open_offsets:
+                ordinal = week_ordinal + open_offset
+                if ordinal > last_ordinal:
+                    break
+                if event := self._get_calendar_event(market_data, ordinal, local_tz):
+                    events.append(event)
 
         return events
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._market_data = self._get_market_data()
+        market_data = self._get_market_data()
+        # Each refresh builds new models, compare by value so that markets
+        # whose data did not change keep their cached events
+        if market_data != self._market_data:
+            self._market_data = market_data
+            self._description = self._build_description(market_data)
+            self._event_cache.clear()
         self.async_write_ha_state()
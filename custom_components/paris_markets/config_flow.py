@@ -21,13 +21,87 @@ from .const import (
     DEFAULT_RADIUS_KM,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    FILTER_ARRONDISSEMENT,
+    FILTER_RADIUS,
     MINIMUM_SCAN_INTERVAL,
     SCAN_INTERVAL,
 )
-from .models import Arrondissement, FilterMode, ProductType
+from .models import Arrondissement, ProductType
 
 _LOGGER = logging.getLogger(__name__)
 
+# Selector options are static, build them once
+_FILTER_MODE_OPTIONS = [
+    selector.SelectOptionDict(value=FILTER_RADIUS, label="Distance from home"),
+    selector.SelectOptionDict(
+        value=FILTER_ARRONDISSEMENT,
+        label="Specific arrondissements",
+    ),
+]
+_ARRONDISSEMENT_OPTIONS = [
+    selector.SelectOptionDict(value=str(arr.value), label=str(arr.value))
+    for arr in Arrondissement
+]
+_PRODUCT_TYPE_OPTIONS = [
+    selector.SelectOptionDict(value=product.value, label=product.value)
+    for product in ProductType
+]
+
+
+def _build_user_schema(filter_mode: str) -> vol.Schema:
+    """Build the user step schema for a filter mode.
+
+    The selected mode's own fields are required, the others stay optional.
+    """
+    schema_dict: dict[Any, Any] = {
+        vol.Required(CONF_FILTER_MODE, default=filter_mode): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=_FILTER_MODE_OPTIONS,
+                translation_key="filter_mode",
+            )
+        )
+    }
+
+    # Always include radius field (optional when not in radius mode)
+    if filter_mode == FILTER_RADIUS:
+        schema_dict[vol.Required(CONF_RADIUS, default=DEFAULT_RADIUS_KM)] = vol.Coerce(
+            float
+        )
+    else:
+        schema_dict[vol.Optional(CONF_RADIUS)] = vol.Coerce(float)
+
+    # Always include arrondissements field (optional when not in arrondissement mode)
+    arrondissements_selector = selector.SelectSelector(
+        selector.SelectSelectorConfig(
+            options=_ARRONDISSEMENT_OPTIONS,
+            multiple=True,
+            translation_key="arrondissements",
+        )
+    )
+    if filter_mode == FILTER_ARRONDISSEMENT:
+        schema_dict[vol.Required(CONF_ARRONDISSEMENTS, default=[])] = (
+            arrondissements_selector
+        )
+    else:
+        schema_dict[vol.Optional(CONF_ARRONDISSEMENTS)] = arrondissements_selector
+
+    schema_dict[vol.Required(CONF_PRODUCT_TYPES, default=DEFAULT_PRODUCT_TYPES)] = (
+        selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=_PRODUCT_TYPE_OPTIONS,
+                multiple=True,
+                translation_key="product_types",
+            )
+        )
+    )
+
+    return vol.Schema(schema_dict)
+
+
+# Only two forms can be shown, compile both once
+_SCHEMA_RADIUS_MODE = _build_user_schema(FILTER_RADIUS)
+_SCHEMA_ARRONDISSEMENT_MODE = _build_user_schema(FILTER_ARRONDISSEMENT)
+
 
 class ParisMarketsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
     """Handle a config flow for Paris Markets."""
@@ -56,7 +130,7 @@ class ParisMarketsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type:
                 )
 
                 # Validate based on filter mode
-                if filter_mode == FilterMode.RADIUS.value:
+                if filter_mode == FILTER_RADIUS:
                     radius = float(user_input[CONF_RADIUS])
                     if radius <= 0:
                         errors["base"] = "invalid_radius"
@@ -65,7 +139,7 @@ class ParisMarketsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type:
                         or self.hass.config.longitude is None
                     ):
                         errors["base"] = "no_home_location"
-                elif filter_mode == FilterMode.ARRONDISSEMENT.value:
+                elif filter_mode == FILTER_ARRONDISSEMENT:
                     arrondissements = user_input.get(CONF_ARRONDISSEMENTS)
                     if not arrondissements:
                         errors["base"] = "no_arrondissements"
@@ -80,14 +154,14 @@ class ParisMarketsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type:
                         CONF_PRODUCT_TYPES: product_types,
                     }
 
-                    if filter_mode == FilterMode.RADIUS.value:
+                    if filter_mode == FILTER_RADIUS:
                         clean_data[CONF_RADIUS] = float(user_input[CONF_RADIUS])
-                    elif filter_mode == FilterMode.ARRONDISSEMENT.value:
+                    elif filter_mode == FILTER_ARRONDISSEMENT:
                         clean_data[CONF_ARRONDISSEMENTS] = user_input[
                             CONF_ARRONDISSEMENTS
                         ]
 
-                    if filter_mode == FilterMode.RADIUS.value:
+                    if filter_mode == FILTER_RADIUS:
                         lat = self.hass.config.latitude
                         lon = self.hass.config.longitude
                         radius = float(user_input[CONF_RADIUS])
@@ -120,85 +194,18 @@ class ParisMarketsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type:
             else DEFAULT_FILTER_MODE
         )
 
-        schema_dict = {
-            vol.Required(
-                CONF_FILTER_MODE, default=filter_mode
-            ): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=[
-                        selector.SelectOptionDict(
-                            value=FilterMode.RADIUS.value, label="Distance from home"
-                        ),
-                        selector.SelectOptionDict(
-                            value=FilterMode.ARRONDISSEMENT.value,
-                            label="Specific arrondissements",
-                        ),
-                    ],
-                    translation_key="filter_mode",
-                )
-            )
-        }
-
-        # Always include radius field (optional when not in radius mode)
-        if filter_mode == FilterMode.RADIUS.value:
-            schema_dict[vol.Required(CONF_RADIUS, default=DEFAULT_RADIUS_KM)] = (
-                vol.Coerce(float)
-            )
-        else:
-            schema_dict[vol.Optional(CONF_RADIUS)] = vol.Coerce(float)
-
-        # Always include arrondissements field (optional when not in arrondissement mode)
-        current_arrondissements = (
-            user_input.get(CONF_ARRONDISSEMENTS, []) if user_input else []
+        data_schema = (
+            _SCHEMA_ARRONDISSEMENT_MODE
+            if filter_mode == FILTER_ARRONDISSEMENT
+            else _SCHEMA_RADIUS_MODE
         )
-        if filter_mode == FilterMode.ARRONDISSEMENT.value:
-            schema_dict[
-                vol.Required(CONF_ARRONDISSEMENTS, default=current_arrondissements)
-            ] = selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=[
-                        selector.SelectOptionDict(
-                            value=str(arr.value),
-                            label=str(arr.value),
-                        )
-                        for arr in Arrondissement
-                    ],
-                    multiple=True,
-                    translation_key="arrondissements",
-                )
-            )
-        else:
-            schema_dict[vol.Optional(CONF_ARRONDISSEMENTS)] = selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=[
-                        selector.SelectOptionDict(
-                            value=str(arr.value),
-                            label=str(arr.value),
-                        )
-                        for arr in Arrondissement
-                    ],
-                    multiple=True,
-                    translation_key="arrondissements",
-                )
+        if user_input:
+            # Keep the arrondissements picked before a validation error
+            data_schema = self.add_suggested_values_to_schema(
+                data_schema,
+                {CONF_ARRONDISSEMENTS: user_input.get(CONF_ARRONDISSEMENTS, [])},
             )
 
-        schema_dict[vol.Required(CONF_PRODUCT_TYPES, default=DEFAULT_PRODUCT_TYPES)] = (
-            selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=[
-                        selector.SelectOptionDict(
-                            value=product.value, label=product.value
-                        )
-                        for product in ProductType
-                    ],
-                    multiple=True,
-                    translation_key="product_types",
-                )
-            )
-        )
-
-        data_schema = vol.Schema(schema_dict)
-
         return self.async_show_form(
             step_id="user",
             data_schema=data_schema,
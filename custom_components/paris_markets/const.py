@@ -1,15 +1,18 @@
 """Constants for the Paris Markets integration."""
 
 from typing import List
+from zoneinfo import ZoneInfo
 
 from .models import FilterMode, ProductType
 
 DOMAIN = "paris_markets"
 ATTRIBUTION = "Data provided by OpenData Paris"
+PARIS_TZ = ZoneInfo("Europe/Paris")
 
 
 # API
 API_ENDPOINT = "https://opendata.paris.fr/api/explore/v2.1/catalog/datasets/marches-decouverts/records"
+API_PAGE_SIZE = 100  # Maximum number of records the API returns per request
 
 # Configuration Keys
 CONF_FILTER_MODE = "filter_mode"
@@ -18,9 +21,13 @@ CONF_ARRONDISSEMENTS = "arrondissements"
 CONF_PRODUCT_TYPES = "product_types"
 SCAN_INTERVAL = "scan_interval"
 
+# Filter mode values as stored in the config entry
+FILTER_RADIUS = FilterMode.RADIUS.value
+FILTER_ARRONDISSEMENT = FilterMode.ARRONDISSEMENT.value
+
 # Default Values
 DEFAULT_ICON = "mdi:basket"
-DEFAULT_FILTER_MODE = FilterMode.RADIUS.value
+DEFAULT_FILTER_MODE = FILTER_RADIUS
 DEFAULT_RADIUS_KM = 2.0
 DEFAULT_ARRONDISSEMENTS: List[int] = []
 DEFAULT_SCAN_INTERVAL = 1
@@ -1,18 +1,20 @@
 """DataUpdateCoordinator for Paris Markets."""
 
+import asyncio
 import logging
 from datetime import datetime, time, timedelta
-from functools import partial
+from functools import lru_cache
 from typing import Any, Dict, Optional
-from zoneinfo import ZoneInfo
 
-import requests
+import aiohttp
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
     API_ENDPOINT,
+    API_PAGE_SIZE,
     CONF_ARRONDISSEMENTS,
     CONF_FILTER_MODE,
     CONF_PRODUCT_TYPES,
@@ -20,14 +22,56 @@ from .const import (
     DEFAULT_PRODUCT_TYPES,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    FILTER_ARRONDISSEMENT,
+    FILTER_RADIUS,
+    PARIS_TZ,
     SCAN_INTERVAL,
 )
-from .models import FilterMode
+from .models import MarketData
 
 _LOGGER = logging.getLogger(__name__)
 
+# Query templates for the API "where" parameter
+DISTANCE_WHERE_TMPL = "within_distance(geo_point_2d, GEOM'POINT(%s %s)', %skm)"
+ARRONDISSEMENT_WHERE_TMPL = "ardt IN (%s)"
+PRODUCT_WHERE_TMPL = "produit IN (%s)"
+
+# (French API field, English field) pairs kept from each raw market
+_FIELD_MAPPING = (
+    ("id_marche", "market_id"),
+    ("nom_long", "long_name"),
+    ("nom_court", "short_name"),
+    ("localisation", "location"),
+    ("ardt", "arrondissement"),
+    ("produit", "product_type"),
+    ("geo_point_2d", "coordinates"),
+)
+
+# (day_id, open flag key, start time key, end time key) for each weekday,
+# weekdays share the same opening hours
+_DAY_CONFIG = (
+    (1, "lundi", "h_deb_sem_1", "h_fin_sem_1"),
+    (2, "mardi", "h_deb_sem_1", "h_fin_sem_1"),
+    (3, "mercredi", "h_deb_sem_1", "h_fin_sem_1"),
+    (4, "jeudi", "h_deb_sem_1", "h_fin_sem_1"),
+    (5, "vendredi", "h_deb_sem_1", "h_fin_sem_1"),
+    (6, "samedi", "h_deb_sam", "h_fin_sam"),
+    (7, "dimanche", "h_deb_dim", "h_fin_dim"),
+)
+
 
-class ParisMarketsDataUpdateCoordinator(DataUpdateCoordinator):
+@lru_cache(maxsize=256)
+def _parse_paris_time(time_boundary: Optional[str]) -> Optional[time]:
+    """Parse an "HH:MM" boundary into a Paris timezone-aware time.
+
+    Markets share a small set of opening hours, so results are cached.
+    """
+    if not time_boundary:
+        return None
+    return datetime.strptime(time_boundary, "%H:%M").time().replace(tzinfo=PARIS_TZ)
+
+
+class ParisMarketsDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, MarketData]]):
     """Class to manage fetching Paris Markets data."""
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -43,6 +87,24 @@ class ParisMarketsDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=scan_interval_seconds),
+            # Market data rarely changes, skip listener callbacks on identical
+            # refreshes. Entities track opening hours themselves.
+            always_update=False,
+        )
+
+        # Filters only change through the config flow, so format them once
+        arrondissements = entry.data.get(CONF_ARRONDISSEMENTS)
+        # API expects simple integers for 'ardt' (e.g., 1, 17)
+        self._arrondissement_where = (
+            ARRONDISSEMENT_WHERE_TMPL % ", ".join(map(str, arrondissements))
+            if arrondissements
+            else None
+        )
+        product_types = entry.data.get(CONF_PRODUCT_TYPES, DEFAULT_PRODUCT_TYPES)
+        self._product_where = (
+            PRODUCT_WHERE_TMPL % ", ".join(f'"{ptype}"' for ptype in product_types)
+            if product_types
+            else None
         )
 
     def _normalise_market_data(self, raw_market: Dict[str, Any]) -> Dict[str, Any]:
@@ -65,78 +127,45 @@ class ParisMarketsDataUpdateCoordinator(DataUpdateCoordinator):
 
     def _normalise_basic_fields(self, raw_market: Dict[str, Any]) -> Dict[str, Any]:
         """Extract and normalise basic market fields."""
-        field_mapping = {
-            "id_marche": "market_id",
-            "nom_long": "long_name",
-            "nom_court": "short_name",
-            "localisation": "location",
-            "ardt": "arrondissement",
-            "produit": "product_type",
-            "geo_point_2d": "coordinates",
-        }
-
         return {
-            field_mapping[french_key]: value
-            for french_key, value in raw_market.items()
-            if french_key in field_mapping
+            english_key: raw_market[french_key]
+            for french_key, english_key in _FIELD_MAPPING
+            if french_key in raw_market
         }
 
-    def _parse_paris_time(self, time_boundary: Optional[str]) -> Optional[time]:
-        if not time_boundary:
-            return None
-        return (
-            datetime.strptime(time_boundary, "%H:%M")
-            .replace(tzinfo=ZoneInfo("Europe/Paris"))
-            .timetz()
-        )
-
     def _create_schedule(
         self, raw_market: Dict[str, Any]
     ) -> Dict[int, Optional[Dict[str, Any]]]:
         """Create a structured schedule from raw market data."""
-        # Configuration for each day type
-        schedule_config = (
-            (range(1, 6), "h_deb_sem_1", "h_fin_sem_1"),
-            ([6], "h_deb_sam", "h_fin_sam"),
-            ([7], "h_deb_dim", "h_fin_dim"),
-        )
-
-        day_names = {
-            1: "lundi",
-            2: "mardi",
-            3: "mercredi",
-            4: "jeudi",
-            5: "vendredi",
-            6: "samedi",
-            7: "dimanche",
-        }
-
         schedule: Dict[int, Optional[Dict[str, Any]]] = {}
 
-        for config in schedule_config:
-            schedule_entry = {
-                "start_time": self._parse_paris_time(raw_market.get(config[1])),
-                "end_time": self._parse_paris_time(raw_market.get(config[2])),
-            }
-
-            for day_id in config[0]:
-                day_name = day_names[day_id]
-                is_open = bool(raw_market.get(day_name, False))
-                schedule[day_id] = schedule_entry if is_open else None
+        for day_id, day_name, start_key, end_key in _DAY_CONFIG:
+            if raw_market.get(day_name, False):
+                schedule[day_id] = {
+                    "start_time": _parse_paris_time(raw_market.get(start_key)),
+                    "end_time": _parse_paris_time(raw_market.get(end_key)),
+                }
+            else:
+                schedule[day_id] = None
 
         return schedule
 
-    async def _async_update_data(self):
+    async def _async_fetch_page(
+        self, session: aiohttp.ClientSession, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Fetch a single page of records from the API."""
+        async with session.get(API_ENDPOINT, params=params) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    async def _async_update_data(self) -> Dict[str, MarketData]:
         """Fetch data from API endpoint."""
         try:
-            filter_mode = self.entry.data.get(CONF_FILTER_MODE, FilterMode.RADIUS.value)
-            product_types = self.entry.data.get(
-                CONF_PRODUCT_TYPES, DEFAULT_PRODUCT_TYPES
-            )
+            filter_mode = self.entry.data.get(CONF_FILTER_MODE, FILTER_RADIUS)
 
             where_clauses = []
 
-            if filter_mode == FilterMode.RADIUS.value:
+            if filter_mode == FILTER_RADIUS:
                 user_lat = self.hass.config.latitude
                 user_lon = self.hass.config.longitude
 
@@ -146,70 +175,69 @@ class ParisMarketsDataUpdateCoordinator(DataUpdateCoordinator):
                     )
 
                 radius_km = self.entry.data[CONF_RADIUS]
+                where_clauses.append(
+                    DISTANCE_WHERE_TMPL % (user_lon, user_lat, radius_km)
+                )
 
-                distance_clause = f"within_distance(geo_point_2d, GEOM'POINT({user_lon} {user_lat})', {radius_km}km)"
-                where_clauses.append(distance_clause)
-
-            elif filter_mode == FilterMode.ARRONDISSEMENT.value:
-                arrondissements = self.entry.data.get(CONF_ARRONDISSEMENTS)
-
-                if arrondissements:
-                    # API expects simple integers for 'ardt' (e.g., 1, 17)
-                    arrondissement_list = ", ".join(
-                        [str(arr) for arr in arrondissements]
-                    )
-                    arrondissement_clause = f"ardt IN ({arrondissement_list})"
-                    where_clauses.append(arrondissement_clause)
+            elif filter_mode == FILTER_ARRONDISSEMENT and self._arrondissement_where:
+                where_clauses.append(self._arrondissement_where)
 
             # Add product type filter
-            if product_types:
-                product_list = ", ".join([f'"{ptype}"' for ptype in product_types])
-                product_clause = f"produit IN ({product_list})"
-                where_clauses.append(product_clause)
-
-            # Combine clauses with AND
-            where_clause = " AND ".join(where_clauses) if where_clauses else "1=1"
+            if self._product_where:
+                where_clauses.append(self._product_where)
 
-            params = {
-                "limit": 100,  # Adjust limit or implement pagination if necessary
-                "where": where_clause,
-            }
+            params: Dict[str, Any] = {"limit": API_PAGE_SIZE}
+            # Without any filter the whole dataset is requested
+            if where_clauses:
+                params["where"] = " AND ".join(where_clauses)
 
             _LOGGER.debug(f"Requesting Paris Markets API with params: {params}")
 
-            response = await self.hass.async_add_executor_job(
-                partial(requests.get, API_ENDPOINT, params=params, timeout=10)
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            if "results" not in data:
-                _LOGGER.warning("No 'results' in API response from Paris Markets")
-                return {}
+            session = async_get_clientsession(self.hass)
+            async with asyncio.timeout(10):
+                data = await self._async_fetch_page(session, params)
+
+                if "results" not in data:
+                    _LOGGER.warning("No 'results' in API response from Paris Markets")
+                    return {}
+
+                # Fetch any remaining pages concurrently over the same session
+                total_count = data.get("total_count", 0)
+                if total_count > API_PAGE_SIZE:
+                    pages = await asyncio.gather(
+                        *(
+                            self._async_fetch_page(
+                                session, {**params, "offset": offset}
+                            )
+                            for offset in range(
+                                API_PAGE_SIZE, total_count, API_PAGE_SIZE
+                            )
+                        )
+                    )
+                    for page in pages:
+                        data["results"].extend(page.get("results", []))
 
-            # Normalise each market's data before processing
-            normalised_markets = []
+            # Normalise each market's data and build the models once per refresh
+            processed_data: Dict[str, MarketData] = {}
             for market in data["results"]:
                 try:
-                    normalised_market = self._normalise_market_data(market)
-                    normalised_markets.append(normalised_market)
+                    market_data = MarketData.from_normalised(
+                        self._normalise_market_data(market)
+                    )
                 except Exception as err:
                     _LOGGER.warning(
                         f"Failed to normalise market data for market {market.get('id_marche', 'unknown')}: {err}"
                     )
-                    normalised_markets.append(market)
+                    continue
+                processed_data[market_data.market_id] = market_data
 
-            processed_data = {
-                market.get("market_id", market.get("id_marche", "unknown")): market
-                for market in normalised_markets
-            }
             _LOGGER.debug(
                 f"Successfully fetched and processed {len(processed_data)} markets using {filter_mode} filtering. "
-                f"Normalised {len(normalised_markets)} market records."
+                f"Received {len(data['results'])} market records."
             )
             return processed_data
 
-        except requests.exceptions.RequestException as err:
+        except (aiohttp.ClientError, TimeoutError) as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
         except KeyError as err:
             _LOGGER.error(f"Configuration data missing: {err}")
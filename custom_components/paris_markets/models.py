@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import date, datetime, time
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, tzinfo
 from enum import Enum
-from typing import Optional
+from typing import Any
 
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
 
@@ -67,13 +66,8 @@ class WeekDay(Enum):
     SATURDAY = 6
     SUNDAY = 7
 
-    @classmethod
-    def from_date(cls, date: date) -> "WeekDay":
-        """Get the ISO weekday enum from a date."""
-        return cls(date.isoweekday())
-
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MarketDaySchedule:
     """Data class for market day schedule."""
 
@@ -104,18 +98,26 @@ class MarketDaySchedule:
 
         return cls(start_time=data.get("start_time"), end_time=data.get("end_time"))
 
-    def as_local_datetimes(self, date: date) -> tuple[datetime, datetime] | None:
-        """Return start and end times as local datetimes."""
-        if not self.is_open():
-            return None
+    def as_local_datetimes(
+        self, date: date, local_tz: tzinfo | None = None
+    ) -> tuple[datetime, datetime]:
+        """Return start and end times as local datetimes.
+
+        Only meaningful for open days, callers check is_open() first.
+        """
+        if local_tz is None:
+            local_tz = dt_util.get_default_time_zone()
 
         return (
-            dt_util.as_local(datetime.combine(date, self.start_time)),  # type: ignore[arg-type]
-            dt_util.as_local(datetime.combine(date, self.end_time)),  # type: ignore[arg-type]
+            datetime.combine(date, self.start_time).astimezone(local_tz),  # type: ignore[arg-type]
+            datetime.combine(date, self.end_time).astimezone(local_tz),  # type: ignore[arg-type]
         )
 
 
-@dataclass
+CLOSED_DAY = MarketDaySchedule(start_time=None, end_time=None)
+
+
+@dataclass(slots=True, frozen=True)
 class MarketData:
     """Data class for market information."""
 
@@ -126,24 +128,36 @@ class MarketData:
     location: str
     product_type: str
     coordinates: dict
-    schedule: dict[WeekDay, MarketDaySchedule]
+    # Indexed by ISO weekday (1=Monday, 7=Sunday), index 0 is unused
+    schedule: tuple[MarketDaySchedule, ...]
+    # Bitmask of open weekdays (bit 0 is Monday), shared by all entities
+    open_mask: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Post-initialisation to derive the open weekdays from the schedule."""
+        # Frozen dataclasses can only set derived fields through object
+        object.__setattr__(
+            self,
+            "open_mask",
+            sum(
+                1 << (day_id - 1)
+                for day_id in range(1, 8)
+                if self.schedule[day_id].is_open()
+            ),
+        )
+
+    def has_open_days(self) -> bool:
+        """Check if the market opens on at least one day of the week."""
+        return self.open_mask != 0
 
     @classmethod
-    def from_coordinator(
-        cls, coordinator: type[DataUpdateCoordinator], market_id: str
-    ) -> Optional["MarketData"]:
-        """Create MarketData from coordinator data."""
-        if coordinator.data is None:
-            return None
-
-        data = coordinator.data.get(market_id)
-        if not data:
-            return None
-
-        schedule = {
-            WeekDay(day_id): MarketDaySchedule.from_maybe_dict(day_schedule)
-            for day_id, day_schedule in data["schedule"].items()
-        }
+    def from_normalised(cls, data: dict[str, Any]) -> "MarketData":
+        """Create MarketData from normalised coordinator market data."""
+        day_schedules = data["schedule"]
+        schedule = (CLOSED_DAY,) + tuple(
+            MarketDaySchedule.from_maybe_dict(day_schedules.get(day_id))
+            for day_id in range(1, 8)
+        )
 
         return cls(
             market_id=data["market_id"],
@@ -1,20 +1,25 @@
 """Test configuration for pytest-homeassistant-custom-component."""
 
-from datetime import time
+from collections.abc import Callable, Mapping
+from datetime import datetime, time
+from types import MappingProxyType, SimpleNamespace
 from typing import Any, Dict
 from unittest.mock import MagicMock
-from zoneinfo import ZoneInfo
 
 import pytest
+from homeassistant.config_entries import SOURCE_USER, ConfigEntry
 
+from custom_components.paris_markets import binary_sensor
+from custom_components.paris_markets.const import DOMAIN, PARIS_TZ
 from custom_components.paris_markets.coordinator import (
     ParisMarketsDataUpdateCoordinator,
 )
+from custom_components.paris_markets.models import MarketData
 
 
 def paris_time(hour: int, minute: int = 0) -> time:
     """Create a timezone-aware time object for Paris timezone."""
-    return time(hour, minute, tzinfo=ZoneInfo("Europe/Paris"))
+    return time(hour, minute, tzinfo=PARIS_TZ)
 
 
 @pytest.fixture(autouse=True)
@@ -127,47 +132,106 @@ MOCK_MARKET_DATA = {
 }
 
 
-@pytest.fixture
-def mock_coordinator() -> MagicMock:
-    """Create a mock coordinator with comprehensive test data."""
-    import copy
+def build_market_data(markets: Dict[str, Dict[str, Any]]) -> Dict[str, MarketData]:
+    """Build coordinator data from normalised market dictionaries."""
+    return {
+        market_id: MarketData.from_normalised(market)
+        for market_id, market in markets.items()
+    }
+
+
+@pytest.fixture(scope="session")
+def mock_market_models() -> Mapping[str, MarketData]:
+    """Build the mock market models once, as a read-only mapping."""
+    return MappingProxyType(build_market_data(MOCK_MARKET_DATA))
 
+
+# Immutable default shared by every test config entry
+_EMPTY_DISCOVERY_KEYS = MappingProxyType({})
+
+
+def _build_config_entry(**overrides: Any) -> ConfigEntry:
+    """Build a Paris Markets config entry, overriding any constructor argument."""
+    return ConfigEntry(
+        **{
+            "version": 1,
+            "minor_version": 1,
+            "domain": DOMAIN,
+            "title": "Paris Markets",
+            "data": {
+                "radius_km": 5.0,
+                "product_types": ["alimentaire"],
+            },
+            "source": SOURCE_USER,
+            "entry_id": "test",
+            "unique_id": None,
+            "discovery_keys": _EMPTY_DISCOVERY_KEYS,
+            "options": {},
+            "subentries_data": [],
+            **overrides,
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def build_config_entry() -> Callable[..., ConfigEntry]:
+    """Return the shared builder of Paris Markets config entries."""
+    return _build_config_entry
+
+
+def _make_mock_coordinator(
+    data: Dict[str, MarketData] | None, last_update_success: bool = True
+) -> MagicMock:
+    """Create a mock coordinator holding the given data."""
     coordinator = MagicMock(spec=ParisMarketsDataUpdateCoordinator)
-    coordinator.data = copy.deepcopy(
-        MOCK_MARKET_DATA
-    )  # Create a fresh copy for each test
+    coordinator.data = data
     coordinator.async_add_listener = MagicMock()
-    coordinator.last_update_success = True
+    coordinator.last_update_success = last_update_success
     coordinator.config_entry = MagicMock()
     coordinator.config_entry.entry_id = "test_integration"
     return coordinator
 
 
+@pytest.fixture
+def mock_coordinator(mock_market_models: Mapping[str, MarketData]) -> MagicMock:
+    """Create a mock coordinator with comprehensive test data."""
+    # Tests add and remove markets, so only the mapping is copied per test
+    return _make_mock_coordinator(dict(mock_market_models))
+
+
 @pytest.fixture
 def empty_coordinator() -> MagicMock:
     """Create a mock coordinator with no data."""
-    coordinator = MagicMock(spec=ParisMarketsDataUpdateCoordinator)
-    coordinator.data = {}
-    coordinator.async_add_listener = MagicMock()
-    coordinator.last_update_success = True
-    coordinator.config_entry = MagicMock()
-    coordinator.config_entry.entry_id = "test_integration"
-    return coordinator
+    return _make_mock_coordinator({})
 
 
 @pytest.fixture
 def failed_coordinator() -> MagicMock:
     """Create a mock coordinator that has failed to update."""
-    coordinator = MagicMock(spec=ParisMarketsDataUpdateCoordinator)
-    coordinator.data = None
-    coordinator.async_add_listener = MagicMock()
-    coordinator.last_update_success = False
-    coordinator.config_entry = MagicMock()
-    coordinator.config_entry.entry_id = "test_integration"
-    return coordinator
+    return _make_mock_coordinator(None, last_update_success=False)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_market_data() -> Dict[str, Any]:
-    """Provide a single market's data for testing."""
+    """Provide a single market's data for testing.
+
+    The dict is shared by every test, copy it before changing it.
+    """
     return MOCK_MARKET_DATA["market_1"]
+
+
+@pytest.fixture
+def freeze_paris_now(monkeypatch: pytest.MonkeyPatch) -> Callable[[datetime], None]:
+    """Provide a helper freezing the binary sensor's clock at a given moment.
+
+    The platform's ``time`` module binding is swapped for a stub, which
+    monkeypatch restores when the test ends.
+    """
+
+    def _freeze(moment: datetime) -> None:
+        timestamp = moment.timestamp()
+        monkeypatch.setattr(
+            binary_sensor, "time", SimpleNamespace(time=lambda: timestamp)
+        )
+
+    return _freeze
@@ -1,83 +1,130 @@
 """Comprehensive tests for the Paris Markets binary sensor platform."""
 
-from datetime import datetime, time
-from unittest.mock import MagicMock, patch
-from zoneinfo import ZoneInfo
+import dataclasses
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import patch
 
 import pytest
+from conftest import paris_time
 from homeassistant.core import HomeAssistant
 
-from custom_components.paris_markets.const import DEFAULT_ICON, DOMAIN
+from custom_components.paris_markets import binary_sensor
+from custom_components.paris_markets.const import DEFAULT_ICON, DOMAIN, PARIS_TZ
 from custom_components.paris_markets.binary_sensor import (
     MarketBinarySensor,
     async_setup_entry,
 )
+from custom_components.paris_markets.models import MarketData
 
 
-def paris_time(hour: int, minute: int = 0) -> time:
-    """Create a timezone-aware time object for Paris timezone."""
-    return time(hour, minute, tzinfo=ZoneInfo("Europe/Paris"))
+def _dt(day: int, hour: int, minute: int) -> datetime:
+    """Create a Paris datetime in the week starting Monday 2025-06-02.
+
+    Day 1=Monday, 2=Tuesday, etc.
+    """
+    return datetime(2025, 6, 1 + day, hour, minute, tzinfo=PARIS_TZ)
+
+
+@pytest.fixture
+def market1_sensor(mock_coordinator) -> MarketBinarySensor:
+    """Create the binary sensor of the Saint-Germain market."""
+    return MarketBinarySensor(mock_coordinator, "market_1")
+
+
+@pytest.fixture(scope="module")
+def malformed_market_data(sample_market_data) -> Mapping[str, MarketData]:
+    """Build coordinator data whose market has an unusual schedule, once."""
+    # Override only the schedule, with one that passes validation but
+    # represents unusual data
+    bad_data = {
+        **sample_market_data,
+        "schedule": {
+            2: None,  # None schedule for Tuesday (this is valid)
+            3: {
+                "start_time": paris_time(23, 59),  # Very late start time
+                "end_time": paris_time(23, 59),  # Same as start time (edge case)
+            },
+        },
+    }
+    return MappingProxyType({"market_1": MarketData.from_normalised(bad_data)})
 
 
 class TestAsyncSetupEntry:
     """Test the async_setup_entry function."""
 
-    @pytest.mark.asyncio
     async def test_setup_with_coordinator_data(
         self, hass: HomeAssistant, mock_coordinator
     ) -> None:
         """Test setting up sensors when coordinator has data."""
-        entry = MagicMock()
-        entry.entry_id = "test_integration"
+        entry = SimpleNamespace(entry_id="test_integration")
         hass.data[DOMAIN] = {entry.entry_id: mock_coordinator}
 
         entities = []
-        async_add_entities = MagicMock(
-            side_effect=lambda ents, update: entities.extend(ents)
-        )
+
+        def async_add_entities(ents, update_before_add=False):
+            entities.extend(ents)
 
         await async_setup_entry(hass, entry, async_add_entities)
 
         # Should create one sensor per market
         assert len(entities) == 3
-        assert all(isinstance(entity, MarketBinarySensor) for entity in entities)
+
+        market_ids = set()
+        for entity in entities:
+            assert isinstance(entity, MarketBinarySensor)
+            market_ids.add(entity.market_id)
+        assert market_ids == {"market_1", "market_2", "market_bio"}
+
+    async def test_setup_skips_markets_never_open(
+        self, hass: HomeAssistant, mock_coordinator, sample_market_data
+    ) -> None:
+        """Test that markets without any opening day get no sensor."""
+        entry = SimpleNamespace(entry_id="test_integration")
+        mock_coordinator.data["market_closed"] = MarketData.from_normalised(
+            {**sample_market_data, "market_id": "market_closed", "schedule": {}}
+        )
+        hass.data[DOMAIN] = {entry.entry_id: mock_coordinator}
+
+        entities = []
+
+        def async_add_entities(ents, update_before_add=False):
+            entities.extend(ents)
+
+        await async_setup_entry(hass, entry, async_add_entities)
 
         market_ids = {entity.market_id for entity in entities}
-        expected_ids = {"market_1", "market_2", "market_bio"}
-        assert market_ids == expected_ids
+        assert market_ids == {"market_1", "market_2", "market_bio"}
 
-    @pytest.mark.asyncio
     async def test_setup_with_empty_coordinator(
         self, hass: HomeAssistant, empty_coordinator
     ) -> None:
         """Test setting up sensors when coordinator has no data."""
-        entry = MagicMock()
-        entry.entry_id = "test_integration"
+        entry = SimpleNamespace(entry_id="test_integration")
         hass.data[DOMAIN] = {entry.entry_id: empty_coordinator}
 
         entities = []
-        async_add_entities = MagicMock(
-            side_effect=lambda ents, update: entities.extend(ents)
-        )
+
+        def async_add_entities(ents, update_before_add=False):
+            entities.extend(ents)
 
         await async_setup_entry(hass, entry, async_add_entities)
 
         # Should create no sensors
         assert len(entities) == 0
 
-    @pytest.mark.asyncio
     async def test_setup_with_failed_coordinator(
         self, hass: HomeAssistant, failed_coordinator
     ) -> None:
         """Test setting up sensors when coordinator has failed."""
-        entry = MagicMock()
-        entry.entry_id = "test_integration"
+        entry = SimpleNamespace(entry_id="test_integration")
         hass.data[DOMAIN] = {entry.entry_id: failed_coordinator}
 
         entities = []
-        async_add_entities = MagicMock(
-            side_effect=lambda ents, update: entities.extend(ents)
-        )
+
+        def async_add_entities(ents, update_before_add=False):
+            entities.extend(ents)
 
         await async_setup_entry(hass, entry, async_add_entities)
 
@@ -94,8 +141,7 @@ class TestMarketBinarySensorInitialization:
 
         assert sensor.market_id == "market_1"
         assert sensor.unique_id == "test_integration_market_1"
-        assert sensor.entity_description.key == "market_market_1"
-        assert sensor.entity_description.name == "Marché Saint-Germain"
+        assert sensor.entity_description.key == "market"
         assert sensor.entity_description.icon == DEFAULT_ICON
         assert sensor.entity_description.translation_key == "market"
         assert sensor._attr_translation_placeholders == {"market_name": "Saint-Germain"}
@@ -107,129 +153,111 @@ class TestMarketBinarySensorInitialization:
 
         assert sensor.market_id == "nonexistent_market"
         assert sensor.unique_id == "test_integration_nonexistent_market"
-        assert sensor.entity_description.name == "Market nonexistent_market"
         assert sensor._attr_translation_placeholders == {
             "market_name": "nonexistent_market"
         }
 
-    def test_sensor_availability(self, mock_coordinator) -> None:
+    def test_sensor_availability(self, mock_coordinator, market1_sensor) -> None:
         """Test sensor availability based on coordinator state."""
-        sensor = MarketBinarySensor(mock_coordinator, "market_1")
-        assert sensor.available is True
+        assert market1_sensor.available is True
 
         # Test when coordinator update fails
         mock_coordinator.last_update_success = False
-        assert sensor.available is False
+        assert market1_sensor.available is False
 
-    def test_sensor_should_poll(self, mock_coordinator) -> None:
+    def test_sensor_should_poll(self, market1_sensor) -> None:
         """Test that sensor should not poll (coordinator-based)."""
-        sensor = MarketBinarySensor(mock_coordinator, "market_1")
-        assert sensor.should_poll is False
+        assert market1_sensor.should_poll is False
+
+
+# (market_id, Paris datetime, expected state) cases for the state logic
+_MARKET_STATE_CASES = [
+    # Market 1 (Saint-Germain): Tue 8-14, Thu 8-14:30, Sat 8-13, Sun 9-13:30
+    ("market_1", _dt(2, 10, 0), True),  # Tuesday 10:00 - open
+    ("market_1", _dt(2, 7, 30), False),  # Tuesday 7:30 - before opening
+    ("market_1", _dt(2, 14, 30), False),  # Tuesday 14:30 - after closing
+    ("market_1", _dt(4, 14, 15), True),  # Thursday 14:15 - still open
+    ("market_1", _dt(4, 14, 45), False),  # Thursday 14:45 - after closing
+    ("market_1", _dt(6, 12, 30), True),  # Saturday 12:30 - open
+    ("market_1", _dt(7, 13, 0), True),  # Sunday 13:00 - open
+    ("market_1", _dt(1, 10, 0), False),  # Monday - closed
+    ("market_1", _dt(3, 10, 0), False),  # Wednesday - closed
+    ("market_1", _dt(5, 10, 0), False),  # Friday - closed
+    # Market 2 (Enfants Rouges): Tue-Fri 8:30-13, Sat 8:30-17, Sun 9-14
+    ("market_2", _dt(2, 9, 0), True),  # Tuesday 9:00 - open
+    ("market_2", _dt(3, 12, 30), True),  # Wednesday 12:30 - open
+    ("market_2", _dt(6, 16, 0), True),  # Saturday 16:00 - open
+    ("market_2", _dt(7, 13, 30), True),  # Sunday 13:30 - open
+    ("market_2", _dt(1, 10, 0), False),  # Monday - closed
+    # Market Bio (Raspail): Sunday only 9-15
+    ("market_bio", _dt(7, 12, 0), True),  # Sunday 12:00 - open
+    ("market_bio", _dt(7, 8, 30), False),  # Sunday 8:30 - before opening
+    ("market_bio", _dt(7, 15, 30), False),  # Sunday 15:30 - after closing
+    ("market_bio", _dt(2, 10, 0), False),  # Tuesday - closed
+]
+# Explicit IDs such as "market_1-Tue-10:00-open", instead of generated ones
+_MARKET_STATE_IDS = [
+    f"{market_id}-{moment:%a-%H:%M}-{'open' if expected_state else 'closed'}"
+    for market_id, moment, expected_state in _MARKET_STATE_CASES
+]
 
 
 class TestMarketBinarySensorStateLogic:
     """Test the core state logic of MarketBinarySensor."""
 
     @pytest.mark.parametrize(
-        "market_id,day,hour,minute,expected_state",
-        [
-            # Market 1 (Saint-Germain): Tue 8-14, Thu 8-14:30, Sat 8-13, Sun 9-13:30
-            ("market_1", 2, 10, 0, True),  # Tuesday 10:00 - open
-            ("market_1", 2, 7, 30, False),  # Tuesday 7:30 - before opening
-            ("market_1", 2, 14, 30, False),  # Tuesday 14:30 - after closing
-            ("market_1", 4, 14, 15, True),  # Thursday 14:15 - still open
-            ("market_1", 4, 14, 45, False),  # Thursday 14:45 - after closing
-            ("market_1", 6, 12, 30, True),  # Saturday 12:30 - open
-            ("market_1", 7, 13, 0, True),  # Sunday 13:00 - open
-            ("market_1", 1, 10, 0, False),  # Monday - closed
-            ("market_1", 3, 10, 0, False),  # Wednesday - closed
-            ("market_1", 5, 10, 0, False),  # Friday - closed
-            # Market 2 (Enfants Rouges): Tue-Fri 8:30-13, Sat 8:30-17, Sun 9-14
-            ("market_2", 2, 9, 0, True),  # Tuesday 9:00 - open
-            ("market_2", 3, 12, 30, True),  # Wednesday 12:30 - open
-            ("market_2", 6, 16, 0, True),  # Saturday 16:00 - open
-            ("market_2", 7, 13, 30, True),  # Sunday 13:30 - open
-            ("market_2", 1, 10, 0, False),  # Monday - closed
-            # Market Bio (Raspail): Sunday only 9-15
-            ("market_bio", 7, 12, 0, True),  # Sunday 12:00 - open
-            ("market_bio", 7, 8, 30, False),  # Sunday 8:30 - before opening
-            ("market_bio", 7, 15, 30, False),  # Sunday 15:30 - after closing
-            ("market_bio", 2, 10, 0, False),  # Tuesday - closed
-        ],
+        "market_id,paris_datetime,expected_state",
+        _MARKET_STATE_CASES,
+        ids=_MARKET_STATE_IDS,
     )
     def test_market_states_comprehensive(
         self,
         mock_coordinator,
         market_id: str,
-        day: int,
-        hour: int,
-        minute: int,
+        paris_datetime: datetime,
         expected_state: bool,
+        freeze_paris_now,
     ) -> None:
         """Test market states comprehensively across different schedules."""
         sensor = MarketBinarySensor(mock_coordinator, market_id)
 
-        # Create a datetime for 2025 (current year) with the specified day
-        # Day 1=Monday, 2=Tuesday, etc.
-        # Start with Monday 2025-06-02 and add days
-        base_date = datetime(2025, 6, 2)  # Monday
-        test_date = base_date.replace(day=base_date.day + (day - 1))
-        test_datetime = test_date.replace(hour=hour, minute=minute)
-        paris_datetime = test_datetime.replace(tzinfo=ZoneInfo("Europe/Paris"))
-
-        with patch(
-            "custom_components.paris_markets.binary_sensor.datetime"
-        ) as mock_datetime:
-            mock_datetime.now.return_value = paris_datetime
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-
-            assert sensor.is_on == expected_state
+        freeze_paris_now(paris_datetime)
+        assert sensor.is_on == expected_state
 
     def test_sensor_state_with_no_market_data(self, empty_coordinator) -> None:
         """Test sensor state when market data is unavailable."""
         sensor = MarketBinarySensor(empty_coordinator, "nonexistent_market")
         assert sensor.is_on is None
 
-    def test_sensor_state_edge_cases(self, mock_coordinator) -> None:
-        """Test edge cases for sensor state calculation."""
+    @pytest.mark.parametrize(
+        "moment,expected_state",
+        [
+            (datetime(2025, 6, 3, 8, 0, 0, tzinfo=PARIS_TZ), True),  # At opening
+            (datetime(2025, 6, 3, 14, 0, 0, tzinfo=PARIS_TZ), True),  # At closing
+            (datetime(2025, 6, 3, 14, 1, 0, tzinfo=PARIS_TZ), False),  # After closing
+        ],
+        ids=["at_opening", "at_closing", "after_closing"],
+    )
+    def test_sensor_state_edge_cases(
+        self,
+        mock_coordinator,
+        moment: datetime,
+        expected_state: bool,
+        freeze_paris_now,
+    ) -> None:
+        """Test edge cases for sensor state calculation on a Tuesday."""
         sensor = MarketBinarySensor(mock_coordinator, "market_1")
 
-        # Test exactly at opening time
-        tuesday_8am = datetime(2025, 6, 3, 8, 0, 0, tzinfo=ZoneInfo("Europe/Paris"))
-        with patch(
-            "custom_components.paris_markets.binary_sensor.datetime"
-        ) as mock_datetime:
-            mock_datetime.now.return_value = tuesday_8am
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-            assert sensor.is_on
-
-        # Test exactly at closing time
-        tuesday_2pm = datetime(2025, 6, 3, 14, 0, 0, tzinfo=ZoneInfo("Europe/Paris"))
-        with patch(
-            "custom_components.paris_markets.binary_sensor.datetime"
-        ) as mock_datetime:
-            mock_datetime.now.return_value = tuesday_2pm
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-            assert sensor.is_on
-
-        # Test one minute after closing
-        tuesday_2_01pm = datetime(2025, 6, 3, 14, 1, 0, tzinfo=ZoneInfo("Europe/Paris"))
-        with patch(
-            "custom_components.paris_markets.binary_sensor.datetime"
-        ) as mock_datetime:
-            mock_datetime.now.return_value = tuesday_2_01pm
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-            assert not sensor.is_on
+        freeze_paris_now(moment)
+        assert sensor.is_on is expected_state
 
 
 class TestMarketBinarySensorAttributes:
     """Test MarketBinarySensor attributes and metadata."""
 
-    def test_extra_state_attributes_with_valid_data(self, mock_coordinator) -> None:
+    def test_extra_state_attributes_with_valid_data(self, market1_sensor) -> None:
         """Test extra state attributes when market data is available."""
-        sensor = MarketBinarySensor(mock_coordinator, "market_1")
-
-        attrs = sensor.extra_state_attributes
+        attrs = market1_sensor.extra_state_attributes
 
         assert attrs is not None
         expected_attrs = {
@@ -238,7 +266,8 @@ class TestMarketBinarySensorAttributes:
             "arrondissement": 6,
             "location": "4-6 Rue Lobineau",
             "product_type": "Alimentaire",
-            "coordinates": {"lat": 48.8566, "lon": 2.3522},
+            "latitude": 48.8566,
+            "longitude": 2.3522,
         }
 
         assert attrs == expected_attrs
@@ -250,13 +279,11 @@ class TestMarketBinarySensorAttributes:
         attrs = sensor.extra_state_attributes
         assert attrs is None
 
-    def test_market_data_caching(self, mock_coordinator) -> None:
+    def test_market_data_caching(self, market1_sensor) -> None:
         """Test that market data is properly retrieved."""
-        sensor = MarketBinarySensor(mock_coordinator, "market_1")
-
         # Access market data multiple times
-        data1 = sensor._get_market_data()
-        data2 = sensor._get_market_data()
+        data1 = market1_sensor._get_market_data()
+        data2 = market1_sensor._get_market_data()
 
         assert data1 is not None
         assert data2 is not None
@@ -285,42 +312,80 @@ class TestMarketBinarySensorAttributes:
 class TestMarketBinarySensorUpdates:
     """Test MarketBinarySensor update handling."""
 
-    def test_coordinator_update_callback(self, mock_coordinator) -> None:
+    def test_coordinator_update_callback(self, market1_sensor) -> None:
         """Test that sensor responds to coordinator updates."""
-        sensor = MarketBinarySensor(mock_coordinator, "market_1")
-
-        # Mock the async_write_ha_state method
-        sensor.async_write_ha_state = MagicMock()
+        # Record state writes instead of writing to hass
+        state_writes = []
+        market1_sensor.async_write_ha_state = lambda: state_writes.append(1)
 
         # Trigger coordinator update
-        sensor._handle_coordinator_update()
+        market1_sensor._handle_coordinator_update()
 
         # Verify state was written
-        sensor.async_write_ha_state.assert_called_once()
+        assert len(state_writes) == 1
+
+    async def test_state_written_at_schedule_boundaries(
+        self, hass: HomeAssistant, market1_sensor, freeze_paris_now
+    ) -> None:
+        """Test that the state flips at closing time without a coordinator update."""
+        market1_sensor.hass = hass
+        state_writes = []
+        market1_sensor.async_write_ha_state = lambda: state_writes.append(
+            market1_sensor.is_on
+        )
+        freeze_paris_now(_dt(2, 13, 59))  # Tuesday, open 8:00-14:00
+        assert market1_sensor.is_on is True
+
+        with patch.object(
+            binary_sensor, "async_track_point_in_utc_time"
+        ) as track_point:
+            await market1_sensor.async_added_to_hass()
+
+            # The closing minute still counts as open
+            _, state_changed, closing = track_point.call_args.args
+            assert closing == _dt(2, 14, 0) + timedelta(seconds=1)
+
+            freeze_paris_now(closing)
+            state_changed(closing)
+
+        assert state_writes == [False]
+        # The next change is the Thursday opening
+        assert track_point.call_args.args[2] == _dt(4, 8, 0)
+
+    def test_unchanged_market_keeps_derived_state(
+        self, mock_coordinator, market1_sensor
+    ) -> None:
+        """Test that a refresh with equal market data keeps the derived state."""
+        market1_sensor.async_write_ha_state = lambda: None
+        schedule_table = market1_sensor._schedule_table
+        attributes = market1_sensor.extra_state_attributes
+
+        # Refreshes build new but equal models for unchanged markets
+        mock_coordinator.data["market_1"] = dataclasses.replace(
+            mock_coordinator.data["market_1"]
+        )
+        market1_sensor._handle_coordinator_update()
 
-    def test_coordinator_listener_registration(self, mock_coordinator) -> None:
+        assert market1_sensor._schedule_table is schedule_table
+        assert market1_sensor.extra_state_attributes is attributes
+
+    def test_coordinator_listener_registration(self, market1_sensor) -> None:
         """Test that sensor registers as coordinator listener."""
         # MarketBinarySensor inherits from CoordinatorEntity which automatically registers listeners
-        sensor = MarketBinarySensor(mock_coordinator, "market_1")
-
         # The listener registration happens in CoordinatorEntity.__init__
         # We can verify the sensor is properly set up to receive updates
-        assert hasattr(sensor, "_handle_coordinator_update")
-        assert callable(sensor._handle_coordinator_update)
+        assert hasattr(market1_sensor, "_handle_coordinator_update")
+        assert callable(market1_sensor._handle_coordinator_update)
 
-    def test_sensor_device_info(self, mock_coordinator) -> None:
+    def test_sensor_device_info(self, market1_sensor) -> None:
         """Test sensor device information."""
-        sensor = MarketBinarySensor(mock_coordinator, "market_1")
-
         # Market sensors shouldn't have device info (they're standalone entities)
-        assert sensor.device_info is None
+        assert market1_sensor.device_info is None
 
-    def test_sensor_entity_category(self, mock_coordinator) -> None:
+    def test_sensor_entity_category(self, market1_sensor) -> None:
         """Test that sensor has no entity category (primary entity)."""
-        sensor = MarketBinarySensor(mock_coordinator, "market_1")
-
         # Market sensors should be primary entities, not diagnostic/config
-        assert sensor.entity_category is None
+        assert market1_sensor.entity_category is None
 
 
 class TestMarketBinarySensorErrorConditions:
@@ -335,6 +400,8 @@ class TestMarketBinarySensorErrorConditions:
 
         # Simulate coordinator losing data
         mock_coordinator.data = None
+        sensor.async_write_ha_state = lambda: None
+        sensor._handle_coordinator_update()
 
         # Should handle gracefully
         assert sensor.is_on is None
@@ -347,49 +414,34 @@ class TestMarketBinarySensorErrorConditions:
         # Initially should work
         assert sensor.is_on is not None
 
+        # The fixture hands out a plain dict, not a synthesised MagicMock child
+        assert type(mock_coordinator.data) is dict
+
         # Remove the specific market
         del mock_coordinator.data["market_1"]
+        sensor.async_write_ha_state = lambda: None
+        sensor._handle_coordinator_update()
 
         # Should handle gracefully
         assert sensor.is_on is None
         assert sensor.extra_state_attributes is None
 
-    def test_malformed_schedule_data(self, mock_coordinator) -> None:
+    def test_malformed_schedule_data(
+        self, mock_coordinator, malformed_market_data, freeze_paris_now
+    ) -> None:
         """Test behavior with malformed schedule data."""
-        # Create a copy of the market data with malformed schedule
-        import copy
-
-        bad_data = copy.deepcopy(mock_coordinator.data["market_1"])
-        # Use a schedule that passes validation but represents unusual data
-        bad_data["schedule"] = {
-            2: None,  # None schedule for Tuesday (this is valid)
-            3: {
-                "start_time": paris_time(23, 59),  # Very late start time
-                "end_time": paris_time(23, 59),  # Same as start time (edge case)
-            },
-        }
-        mock_coordinator.data = {"market_1": bad_data}
+        mock_coordinator.data = dict(malformed_market_data)
 
         sensor = MarketBinarySensor(mock_coordinator, "market_1")
 
         # Should handle edge case data gracefully
-        tuesday_10am = datetime(2025, 6, 3, 10, 0, 0, tzinfo=ZoneInfo("Europe/Paris"))
-        with patch(
-            "custom_components.paris_markets.binary_sensor.datetime"
-        ) as mock_datetime:
-            mock_datetime.now.return_value = tuesday_10am
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-            # Should return closed due to no schedule on Tuesday
-            assert not sensor.is_on
+        tuesday_10am = datetime(2025, 6, 3, 10, 0, 0, tzinfo=PARIS_TZ)
+        freeze_paris_now(tuesday_10am)
+        # Should return closed due to no schedule on Tuesday
+        assert not sensor.is_on
 
         # Test the edge case schedule on Wednesday
-        wednesday_11pm = datetime(
-            2025, 6, 4, 23, 59, 0, tzinfo=ZoneInfo("Europe/Paris")
-        )
-        with patch(
-            "custom_components.paris_markets.binary_sensor.datetime"
-        ) as mock_datetime:
-            mock_datetime.now.return_value = wednesday_11pm
-            mock_datetime.side_effect = lambda *args, **kw: datetime(*args, **kw)
-            # Should be open exactly at the edge time
-            assert sensor.is_on
+        wednesday_11pm = datetime(2025, 6, 4, 23, 59, 0, tzinfo=PARIS_TZ)
+        freeze_paris_now(wednesday_11pm)
+        # Should be open exactly at the edge time
+        assert sensor.is_on
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 from datetime import datetime, timedelta, date
 from unittest.mock import patch
 
@@ -9,8 +10,9 @@ import pytest
 from homeassistant.components.calendar import CalendarEvent
 from homeassistant.core import HomeAssistant
 
+from custom_components.paris_markets import calendar as calendar_platform
 from custom_components.paris_markets.calendar import MarketCalendar, async_setup_entry
-from custom_components.paris_markets.const import DOMAIN
+from custom_components.paris_markets.const import DOMAIN, PARIS_TZ
 
 
 class TestMarketCalendarInitialization:
@@ -35,12 +37,20 @@ class TestMarketCalendarInitialization:
         """Test calendar name and attributes."""
         calendar = MarketCalendar(mock_coordinator, "market_1")
 
-        # Test the entity description name instead of the translated name
-        # since translations are complex to mock properly
-        assert (
-            "Saint-Germain" in calendar.entity_description.name
-            or "Marché" in calendar.entity_description.name
-        )
+        # The name is rendered from the "market" translation with the market
+        # name placeholder, since translations are complex to mock properly
+        assert calendar.entity_description.translation_key == "market"
+        assert calendar._attr_translation_placeholders == {
+            "market_name": "Marché Saint-Germain"
+        }
+
+    def test_calendars_share_entity_description(self, mock_coordinator) -> None:
+        """Test that all market calendars share a single entity description."""
+        calendar_1 = MarketCalendar(mock_coordinator, "market_1")
+        calendar_2 = MarketCalendar(mock_coordinator, "market_2")
+
+        assert calendar_1.entity_description is calendar_2.entity_description
+        assert calendar_1.unique_id != calendar_2.unique_id
 
 
 class TestMarketCalendarEventCreation:
@@ -191,6 +201,23 @@ class TestMarketCalendarEventRetrieval:
         events = await calendar.async_get_events(hass, start_date, end_date)
         assert len(events) == 0
 
+    @pytest.mark.asyncio
+    async def test_get_events_range_without_open_weekday(
+        self, hass: HomeAssistant, mock_coordinator
+    ) -> None:
+        """Test that a range covering none of the open weekdays has no events."""
+        # Bio market (Sunday only)
+        calendar = MarketCalendar(mock_coordinator, "market_bio")
+
+        start_date = datetime(2025, 6, 2)  # Monday
+        end_date = datetime(2025, 6, 7)  # Saturday
+
+        with patch.object(calendar, "_get_calendar_event") as mock_get_event:
+            events = await calendar.async_get_events(hass, start_date, end_date)
+
+        assert events == []
+        mock_get_event.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_events_long_range(
         self, hass: HomeAssistant, mock_coordinator
@@ -215,11 +242,43 @@ class TestMarketCalendarEventRetrieval:
 class TestMarketCalendarProperties:
     """Test calendar properties and state."""
 
-    def test_event_property_returns_none(self, mock_coordinator) -> None:
-        """Test that the event property returns None (as expected for calendar entities)."""
+    @pytest.mark.parametrize(
+        ("now", "expected_start"),
+        [
+            # Tuesday during opening hours returns the ongoing event
+            (
+                datetime(2025, 6, 3, 10, 0, tzinfo=PARIS_TZ),
+                datetime(2025, 6, 3, 8, 0, tzinfo=PARIS_TZ),
+            ),
+            # Tuesday after closing returns Thursday's event
+            (
+                datetime(2025, 6, 3, 15, 0, tzinfo=PARIS_TZ),
+                datetime(2025, 6, 5, 8, 0, tzinfo=PARIS_TZ),
+            ),
+            # Monday (closed) returns Tuesday's event
+            (
+                datetime(2025, 6, 2, 12, 0, tzinfo=PARIS_TZ),
+                datetime(2025, 6, 3, 8, 0, tzinfo=PARIS_TZ),
+            ),
+        ],
+    )
+    def test_event_property_returns_next_event(
+        self, mock_coordinator, now: datetime, expected_start: datetime
+    ) -> None:
+        """Test that the event property returns the current or next event."""
         calendar = MarketCalendar(mock_coordinator, "market_1")
 
-        # Calendar entities don't provide next event directly
+        with patch.object(calendar_platform.dt_util, "now", return_value=now):
+            event = calendar.event
+
+        assert event is not None
+        assert event.start == expected_start
+        assert event.summary == "Marché Saint-Germain"
+
+    def test_event_property_without_market_data(self, empty_coordinator) -> None:
+        """Test that the event property returns None without market data."""
+        calendar = MarketCalendar(empty_coordinator, "nonexistent_market")
+
         assert calendar.event is None
 
     def test_calendar_availability(self, mock_coordinator) -> None:
@@ -314,9 +373,9 @@ class TestMarketCalendarUpdates:
         assert original_data is not None
 
         # Simulate data update by changing coordinator data
-        updated_data = dict(mock_coordinator.data["market_1"])
-        updated_data["long_name"] = "Updated Market Name"
-        mock_coordinator.data["market_1"] = updated_data
+        mock_coordinator.data["market_1"] = dataclasses.replace(
+            mock_coordinator.data["market_1"], long_name="Updated Market Name"
+        )
 
         # Mock the async_write_ha_state method to avoid hass context issues
         with patch.object(calendar, "async_write_ha_state") as mock_write_state:
@@ -327,3 +386,37 @@ class TestMarketCalendarUpdates:
 
             # Verify state was written
             mock_write_state.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_event_cache_cleared_on_market_update(
+        self, hass: HomeAssistant, mock_coordinator
+    ) -> None:
+        """Test that events are reused until the market data changes."""
+        calendar = MarketCalendar(mock_coordinator, "market_1")
+
+        start_date = datetime(2025, 6, 2)
+        end_date = datetime(2025, 6, 8)
+
+        first = await calendar.async_get_events(hass, start_date, end_date)
+        second = await calendar.async_get_events(hass, start_date, end_date)
+        assert all(a is b for a, b in zip(first, second))
+
+        # Refreshes build new but equal models for unchanged markets
+        mock_coordinator.data["market_1"] = dataclasses.replace(
+            mock_coordinator.data["market_1"]
+        )
+        with patch.object(calendar, "async_write_ha_state"):
+            calendar._handle_coordinator_update()
+
+        unchanged = await calendar.async_get_events(hass, start_date, end_date)
+        assert all(a is b for a, b in zip(first, unchanged))
+
+        mock_coordinator.data["market_1"] = dataclasses.replace(
+            mock_coordinator.data["market_1"], long_name="Updated Market Name"
+        )
+        with patch.object(calendar, "async_write_ha_state"):
+            calendar._handle_coordinator_update()
+
+        updated = await calendar.async_get_events(hass, start_date, end_date)
+        assert len(updated) == len(first)
+        assert all(event.summary == "Updated Market Name" for event in updated)
@@ -1,6 +1,7 @@
 """Test the Paris Markets config flow."""
 
-from types import MappingProxyType
+from collections.abc import Callable
+from typing import Any
 from unittest.mock import patch
 
 import pytest
@@ -8,6 +9,7 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 
+from custom_components import paris_markets
 from custom_components.paris_markets.const import (
     CONF_ARRONDISSEMENTS,
     CONF_FILTER_MODE,
@@ -15,136 +17,131 @@ from custom_components.paris_markets.const import (
     CONF_RADIUS,
     DOMAIN,
 )
+from custom_components.paris_markets.coordinator import (
+    ParisMarketsDataUpdateCoordinator,
+)
 from custom_components.paris_markets.models import FilterMode
 
-pytestmark = pytest.mark.asyncio
-
 
-async def test_form_user(hass: HomeAssistant) -> None:
-    """Test we get the form."""
+@pytest.fixture
+async def started_flow(hass: HomeAssistant) -> str:
+    """Start a user config flow and return its flow id."""
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={"source": config_entries.SOURCE_USER}
     )
     assert result["type"] == FlowResultType.FORM
     assert result["errors"] == {}
+    return result["flow_id"]
 
-    with (
-        patch(
-            "custom_components.paris_markets.coordinator.ParisMarketsDataUpdateCoordinator.async_config_entry_first_refresh",
-            return_value=None,
-        ),
-        patch(
-            "custom_components.paris_markets.async_setup_entry",
-            return_value=True,
-        ) as mock_setup_entry,
-    ):
-        result2 = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
+
+@pytest.fixture
+def make_entry(
+    hass: HomeAssistant,
+    build_config_entry: Callable[..., config_entries.ConfigEntry],
+) -> Callable[..., config_entries.ConfigEntry]:
+    """Return a factory registering Paris Markets config entries with hass."""
+
+    def _make_entry(**overrides: Any) -> config_entries.ConfigEntry:
+        entry = build_config_entry(**overrides)
+        hass.config_entries._entries[entry.entry_id] = entry
+        return entry
+
+    return _make_entry
+
+
+@pytest.mark.parametrize(
+    ("user_input", "expected_title"),
+    [
+        (
             {
                 CONF_FILTER_MODE: FilterMode.RADIUS.value,
                 CONF_RADIUS: 5.0,
                 CONF_PRODUCT_TYPES: ["Alimentaire", "Alimentaire bio"],
             },
-        )
-        await hass.async_block_till_done()
-
-    assert result2["type"] == FlowResultType.CREATE_ENTRY
-    assert result2["title"] == "Paris Markets (5.0km radius)"
-    assert result2["data"] == {
-        CONF_FILTER_MODE: FilterMode.RADIUS.value,
-        CONF_RADIUS: 5.0,
-        CONF_PRODUCT_TYPES: ["Alimentaire", "Alimentaire bio"],
-    }
-    assert len(mock_setup_entry.mock_calls) == 1
-
-
-async def test_form_user_arrondissement_mode(hass: HomeAssistant) -> None:
-    """Test we get the form with arrondissement mode."""
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": config_entries.SOURCE_USER}
-    )
-    assert result["type"] == FlowResultType.FORM
-    assert result["errors"] == {}
-
-    with (
-        patch(
-            "custom_components.paris_markets.coordinator.ParisMarketsDataUpdateCoordinator.async_config_entry_first_refresh",
-            return_value=None,
+            "Paris Markets (5.0km radius)",
         ),
-        patch(
-            "custom_components.paris_markets.async_setup_entry",
-            return_value=True,
-        ) as mock_setup_entry,
-    ):
-        result2 = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
+        (
             {
                 CONF_FILTER_MODE: FilterMode.ARRONDISSEMENT.value,
                 CONF_ARRONDISSEMENTS: ["1", "2"],
                 CONF_PRODUCT_TYPES: ["Alimentaire", "Alimentaire bio"],
             },
+            "Paris Markets (2 arrondissements)",
+        ),
+    ],
+)
+async def test_form_user(
+    hass: HomeAssistant,
+    started_flow: str,
+    user_input: dict[str, Any],
+    expected_title: str,
+) -> None:
+    """Test we create an entry for each filter mode."""
+    with (
+        patch.object(
+            ParisMarketsDataUpdateCoordinator,
+            "async_config_entry_first_refresh",
+            return_value=None,
+        ),
+        patch.object(
+            paris_markets, "async_setup_entry", return_value=True
+        ) as mock_setup_entry,
+    ):
+        # Config entry setup is awaited as part of finishing the flow, so no
+        # need to wait for the whole event loop to settle
+        result = await hass.config_entries.flow.async_configure(
+            started_flow, user_input
         )
-        await hass.async_block_till_done()
 
-    assert result2["type"] == FlowResultType.CREATE_ENTRY
-    assert result2["title"] == "Paris Markets (2 arrondissements)"
-    assert result2["data"] == {
-        CONF_FILTER_MODE: FilterMode.ARRONDISSEMENT.value,
-        CONF_ARRONDISSEMENTS: ["1", "2"],
-        CONF_PRODUCT_TYPES: ["Alimentaire", "Alimentaire bio"],
-    }
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["title"] == expected_title
+    assert result["data"] == user_input
     assert len(mock_setup_entry.mock_calls) == 1
 
 
-async def test_form_invalid_radius(hass: HomeAssistant) -> None:
-    """Test we handle invalid radius."""
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": config_entries.SOURCE_USER}
-    )
-
-    result2 = await hass.config_entries.flow.async_configure(
-        result["flow_id"],
-        {
-            CONF_FILTER_MODE: FilterMode.RADIUS.value,
-            CONF_RADIUS: 0.0,  # Invalid radius
-            CONF_PRODUCT_TYPES: ["Alimentaire"],
-        },
-    )
-
-    assert result2["type"] == FlowResultType.FORM
-    assert result2["errors"] == {"base": "invalid_radius"}
-
-
-async def test_form_no_arrondissements(hass: HomeAssistant) -> None:
-    """Test we handle no arrondissements selected."""
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": config_entries.SOURCE_USER}
-    )
-
-    result2 = await hass.config_entries.flow.async_configure(
-        result["flow_id"],
-        {
-            CONF_FILTER_MODE: FilterMode.ARRONDISSEMENT.value,
-            CONF_ARRONDISSEMENTS: [],  # No arrondissements selected
-            CONF_PRODUCT_TYPES: ["Alimentaire"],
-        },
-    )
+@pytest.mark.parametrize(
+    ("user_input", "expected_error"),
+    [
+        (
+            {
+                CONF_FILTER_MODE: FilterMode.RADIUS.value,
+                CONF_RADIUS: 0.0,  # Invalid radius
+                CONF_PRODUCT_TYPES: ["Alimentaire"],
+            },
+            "invalid_radius",
+        ),
+        (
+            {
+                CONF_FILTER_MODE: FilterMode.ARRONDISSEMENT.value,
+                CONF_ARRONDISSEMENTS: [],  # No arrondissements selected
+                CONF_PRODUCT_TYPES: ["Alimentaire"],
+            },
+            "no_arrondissements",
+        ),
+    ],
+)
+async def test_form_invalid_input(
+    hass: HomeAssistant,
+    started_flow: str,
+    user_input: dict[str, Any],
+    expected_error: str,
+) -> None:
+    """Test we show the form again with an error for invalid input."""
+    result = await hass.config_entries.flow.async_configure(started_flow, user_input)
 
-    assert result2["type"] == FlowResultType.FORM
-    assert result2["errors"] == {"base": "no_arrondissements"}
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"base": expected_error}
 
 
-async def test_form_no_location_configured(hass: HomeAssistant) -> None:
+async def test_form_no_location_configured(
+    hass: HomeAssistant, started_flow: str
+) -> None:
     """Test we handle no Home Assistant location configured."""
     hass.config.latitude = None
     hass.config.longitude = None
 
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": config_entries.SOURCE_USER}
-    )
-
-    result2 = await hass.config_entries.flow.async_configure(
-        result["flow_id"],
+    result = await hass.config_entries.flow.async_configure(
+        started_flow,
         {
             CONF_FILTER_MODE: FilterMode.RADIUS.value,
             CONF_RADIUS: 5.0,
@@ -152,30 +149,13 @@ async def test_form_no_location_configured(hass: HomeAssistant) -> None:
         },
     )
 
-    assert result2["type"] == FlowResultType.FORM
-    assert result2["errors"] == {"base": "no_home_location"}
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"base": "no_home_location"}
 
 
-async def test_options_flow(hass: HomeAssistant) -> None:
+async def test_options_flow(hass: HomeAssistant, make_entry) -> None:
     """Test options flow."""
-    entry = config_entries.ConfigEntry(
-        version=1,
-        minor_version=1,
-        domain=DOMAIN,
-        title="Paris Markets",
-        data={
-            "radius_km": 5.0,
-            "product_types": ["alimentaire"],
-        },
-        source=config_entries.SOURCE_USER,
-        entry_id="test",
-        unique_id=None,
-        discovery_keys=MappingProxyType({}),
-        options={},
-        subentries_data=[],
-    )
-
-    hass.config_entries._entries[entry.entry_id] = entry
+    entry = make_entry()
 
     result = await hass.config_entries.options.async_init(entry.entry_id)
     assert result["type"] == FlowResultType.FORM
@@ -190,26 +170,11 @@ async def test_options_flow(hass: HomeAssistant) -> None:
     assert result2["data"] == {"scan_interval": 86400}
 
 
-async def test_options_flow_invalid_scan_interval(hass: HomeAssistant) -> None:
+async def test_options_flow_invalid_scan_interval(
+    hass: HomeAssistant, make_entry
+) -> None:
     """Test options flow with invalid scan interval (below 1 day minimum)."""
-    entry = config_entries.ConfigEntry(
-        version=1,
-        minor_version=1,
-        domain=DOMAIN,
-        title="Paris Markets",
-        data={
-            "radius_km": 5.0,
-            "product_types": ["alimentaire"],
-        },
-        source=config_entries.SOURCE_USER,
-        entry_id="test",
-        unique_id=None,
-        discovery_keys=MappingProxyType({}),
-        options={},
-        subentries_data=[],
-    )
-
-    hass.config_entries._entries[entry.entry_id] = entry
+    entry = make_entry()
 
     result = await hass.config_entries.options.async_init(entry.entry_id)
     assert result["type"] == FlowResultType.FORM
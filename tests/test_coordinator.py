@@ -1,91 +1,213 @@
 """Test the Paris Markets coordinator."""
 
+from collections.abc import Callable
 from datetime import time
 from types import MappingProxyType
-from unittest.mock import MagicMock, patch
 
+import aiohttp
 import pytest
-import pytz
-import requests
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import UpdateFailed
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+)
 
 from custom_components.paris_markets.const import (
+    API_ENDPOINT,
     CONF_ARRONDISSEMENTS,
     CONF_FILTER_MODE,
     CONF_PRODUCT_TYPES,
     CONF_RADIUS,
-    DOMAIN,
+    PARIS_TZ,
     FilterMode,
 )
 from custom_components.paris_markets.coordinator import (
     ParisMarketsDataUpdateCoordinator,
 )
 
-pytestmark = pytest.mark.asyncio
-
 
 def _paris_time(time_str: str) -> time:
     """Helper function to create timezone-aware time objects for Paris timezone."""
     if not time_str:
         return None
 
-    paris_tz = pytz.timezone("Europe/Paris")
     hour, minute = time_str.split(":")
-    return time(int(hour), int(minute), tzinfo=paris_tz)
+    return time(int(hour), int(minute), tzinfo=PARIS_TZ)
+
+
+def _sched(start: str, end: str) -> dict:
+    """Build the normalised schedule entry of an open day."""
+    return {"start_time": _paris_time(start), "end_time": _paris_time(end)}
+
+
+# Expected schedule entries shared by the normalisation cases
+_WD_8_14 = _sched("08:00", "14:00")
+_WD_9_15 = _sched("09:00", "15:00")
+_SAT_8_13 = _sched("08:00", "13:00")
+_SAT_830_1230 = _sched("08:30", "12:30")
+_SUN_10_13 = _sched("10:00", "13:00")
+
+# Day IDs of a normalised schedule (1=Monday, 7=Sunday)
+_ALL_DAY_IDS = frozenset(range(1, 8))
+
+# API payload shared by the update tests, the mocked responses are
+# serialised so the coordinator never sees this object itself
+_MARKET_RESPONSE = {
+    "results": [
+        {
+            "id_marche": "1",
+            "nom_long": "Test Market",
+            "nom_court": "test",
+            "ardt": 1,  # Integer arrondissement number
+            "localisation": "Test Location",
+            "produit": "Alimentaire",
+            "h_deb_sem_1": "08:00",
+            "h_fin_sem_1": "14:00",
+            "h_deb_sam": "08:00",
+            "h_fin_sam": "15:00",
+            "h_deb_dim": "",
+            "h_fin_dim": "",
+            "lundi": 0,
+            "mardi": 1,
+            "mercredi": 0,
+            "jeudi": 1,
+            "vendredi": 0,
+            "samedi": 1,
+            "dimanche": 0,
+            "geo_point_2d": {"lat": 48.8566, "lon": 2.3522},
+        }
+    ]
+}
+
+# Raw market data with French field names
+_RAW_MARKET_DATA = MappingProxyType(
+    {
+        "id_marche": "123",
+        "nom_long": "Marché Saint-Germain",
+        "nom_court": "Saint-Germain",
+        "localisation": "Place Saint-Germain",
+        "ardt": "6",
+        "produit": "Alimentaire",
+        "jours_tenue": "Mardi, Samedi",
+        "gestionnaire": "Ville de Paris",
+        "secteur": "Test Sector",
+        "lineaire": "150",
+        "h_deb_sem_1": "08:00",
+        "h_fin_sem_1": "14:00",
+        "h_deb_sam": "08:00",
+        "h_fin_sam": "13:00",
+        "h_deb_dim": None,
+        "h_fin_dim": None,
+        "lundi": 0,  # Monday - closed
+        "mardi": 1,  # Tuesday - open
+        "mercredi": 0,  # Wednesday - closed
+        "jeudi": 0,  # Thursday - closed
+        "vendredi": 0,  # Friday - closed
+        "samedi": 1,  # Saturday - open
+        "dimanche": 0,  # Sunday - closed
+        "geo_point_2d": {"lat": 48.8566, "lon": 2.3522},
+    }
+)
 
+# Raw market data with all possible schedule configurations
+_RAW_MARKET_DATA_ALL_SCHEDULES = MappingProxyType(
+    {
+        "id_marche": "456",
+        "nom_long": "Test Market",
+        "h_deb_sem_1": "09:00",  # Weekday start
+        "h_fin_sem_1": "15:00",  # Weekday end
+        "h_deb_sam": "08:30",  # Saturday start
+        "h_fin_sam": "12:30",  # Saturday end
+        "h_deb_dim": "10:00",  # Sunday start
+        "h_fin_dim": "13:00",  # Sunday end
+        "lundi": 1,
+        "mardi": 1,
+        "mercredi": 0,
+        "jeudi": 1,
+        "vendredi": 1,
+        "samedi": 1,
+        "dimanche": 1,
+    }
+)
+
+# Raw market data with weekday times only
+_RAW_MARKET_DATA_PARTIAL = MappingProxyType(
+    {
+        "id_marche": "789",
+        "nom_long": "Partial Schedule Market",
+        "h_deb_sem_1": "08:00",  # Only weekday times
+        "h_fin_sem_1": "14:00",
+        # No Saturday or Sunday times
+        "lundi": 1,  # Monday - open
+        "mardi": 1,  # Tuesday - open
+        "mercredi": 0,  # Wednesday - closed
+        "jeudi": 0,  # Thursday - closed
+        "vendredi": 0,  # Friday - closed
+        "samedi": 0,  # Closed on Saturday
+        "dimanche": 0,  # Closed on Sunday
+    }
+)
 
-@pytest.fixture
-def coordinator(hass: HomeAssistant):
-    """Create a coordinator for testing."""
 
-    entry = ConfigEntry(
-        version=1,
-        minor_version=1,
-        domain=DOMAIN,
-        title="Paris Markets",
+# Config entries are never mutated by the coordinator, so build them once
+@pytest.fixture(scope="module")
+def radius_entry(build_config_entry: Callable[..., ConfigEntry]) -> ConfigEntry:
+    """Create a config entry filtering markets by radius."""
+    return build_config_entry(
         data={
             CONF_FILTER_MODE: FilterMode.RADIUS.value,
             CONF_RADIUS: 5.0,
             CONF_PRODUCT_TYPES: ["Alimentaire"],
-        },
-        source="user",
-        entry_id="test",
-        unique_id=None,
-        discovery_keys=MappingProxyType({}),
-        options={},
-        subentries_data=[],
+        }
     )
-    return ParisMarketsDataUpdateCoordinator(hass, entry)
 
 
-@pytest.fixture
-def coordinator_arrondissement(hass: HomeAssistant):
-    """Create a coordinator for arrondissement testing."""
-
-    entry = ConfigEntry(
-        version=1,
-        minor_version=1,
-        domain=DOMAIN,
-        title="Paris Markets",
+@pytest.fixture(scope="module")
+def arrondissement_entry(
+    build_config_entry: Callable[..., ConfigEntry],
+) -> ConfigEntry:
+    """Create a config entry filtering markets by arrondissement."""
+    return build_config_entry(
         data={
             CONF_FILTER_MODE: FilterMode.ARRONDISSEMENT.value,
             CONF_ARRONDISSEMENTS: ["75001", "75002"],
             CONF_PRODUCT_TYPES: ["Alimentaire"],
-        },
-        source="user",
-        entry_id="test",
-        unique_id=None,
-        discovery_keys=MappingProxyType({}),
-        options={},
-        subentries_data=[],
+        }
     )
-    return ParisMarketsDataUpdateCoordinator(hass, entry)
 
 
-async def test_coordinator_successful_update(hass: HomeAssistant, coordinator):
+@pytest.fixture
+def coordinator(hass: HomeAssistant, radius_entry: ConfigEntry):
+    """Create a coordinator for testing."""
+    return ParisMarketsDataUpdateCoordinator(hass, radius_entry)
+
+
+@pytest.fixture
+def coordinator_arrondissement(hass: HomeAssistant, arrondissement_entry: ConfigEntry):
+    """Create a coordinator for arrondissement testing."""
+    return ParisMarketsDataUpdateCoordinator(hass, arrondissement_entry)
+
+
+async def test_coordinator_successful_update(
+    hass: HomeAssistant, coordinator, aioclient_mock: AiohttpClientMocker
+):
     """Test successful data update."""
+    aioclient_mock.get(API_ENDPOINT, json=_MARKET_RESPONSE)
+
+    result = await coordinator._async_update_data()
+
+    assert len(result) == 1
+    assert "1" in result
+    assert result["1"].long_name == "Test Market"
+    # Open on Tuesday, Thursday and Saturday
+    assert result["1"].open_mask == 0b0101010
+
+
+async def test_coordinator_skips_malformed_market(
+    hass: HomeAssistant, coordinator, aioclient_mock: AiohttpClientMocker
+):
+    """Test that markets which cannot be normalised are dropped."""
     mock_response_data = {
         "results": [
             {
@@ -97,183 +219,123 @@ async def test_coordinator_successful_update(hass: HomeAssistant, coordinator):
                 "produit": "Alimentaire",
                 "h_deb_sem_1": "08:00",
                 "h_fin_sem_1": "14:00",
-                "h_deb_sam": "08:00",
-                "h_fin_sam": "15:00",
-                "h_deb_dim": "",
-                "h_fin_dim": "",
-                "lundi": 0,
                 "mardi": 1,
-                "mercredi": 0,
-                "jeudi": 1,
-                "vendredi": 0,
-                "samedi": 1,
-                "dimanche": 0,
                 "geo_point_2d": {"lat": 48.8566, "lon": 2.3522},
-            }
+            },
+            {
+                "id_marche": "2",
+                "nom_long": "Broken Market",
+                # Missing location, arrondissement and product fields
+            },
         ]
     }
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = mock_response_data
-    mock_response.raise_for_status.return_value = None
+    aioclient_mock.get(API_ENDPOINT, json=mock_response_data)
 
-    async def mock_executor_job(func, *args, **kwargs):
-        """Mock the async_add_executor_job to call function directly."""
-        return func(*args, **kwargs)
+    result = await coordinator._async_update_data()
 
-    with (
-        patch.object(hass, "async_add_executor_job", side_effect=mock_executor_job),
-        patch(
-            "custom_components.paris_markets.coordinator.requests.get",
-            return_value=mock_response,
-        ),
-    ):
-        result = await coordinator._async_update_data()
+    assert list(result) == ["1"]
+
+
+async def test_coordinator_fetches_all_pages(
+    hass: HomeAssistant,
+    coordinator,
+    aioclient_mock: AiohttpClientMocker,
+):
+    """Test that results beyond the first page are fetched and merged."""
+
+    def _market(market_id: str) -> dict:
+        return {
+            "id_marche": market_id,
+            "nom_long": f"Market {market_id}",
+            "nom_court": market_id,
+            "ardt": "75001",
+            "localisation": "Test Location",
+            "produit": "Alimentaire",
+            "h_deb_sem_1": "08:00",
+            "h_fin_sem_1": "14:00",
+            "mardi": 1,
+            "geo_point_2d": {"lat": 48.8566, "lon": 2.3522},
+        }
+
+    # More specific offset mocks must be registered before the first page
+    aioclient_mock.get(
+        API_ENDPOINT,
+        params={"offset": 200},
+        json={"total_count": 250, "results": [_market("3")]},
+    )
+    aioclient_mock.get(
+        API_ENDPOINT,
+        params={"offset": 100},
+        json={"total_count": 250, "results": [_market("2")]},
+    )
+    aioclient_mock.get(
+        API_ENDPOINT, json={"total_count": 250, "results": [_market("1")]}
+    )
+
+    result = await coordinator._async_update_data()
 
-        assert len(result) == 1
-        assert "1" in result
-        assert result["1"]["long_name"] == "Test Market"
+    assert aioclient_mock.call_count == 3
+    assert set(result) == {"1", "2", "3"}
 
 
-async def test_coordinator_api_error(hass: HomeAssistant, coordinator):
+async def test_coordinator_api_error(
+    hass: HomeAssistant, coordinator, aioclient_mock: AiohttpClientMocker
+):
     """Test API error handling."""
-    mock_response = MagicMock()
-    mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
-        "API Error"
-    )
+    aioclient_mock.get(API_ENDPOINT, status=500)
 
-    with patch(
-        "custom_components.paris_markets.coordinator.requests.get",
-        return_value=mock_response,
-    ):
-        with pytest.raises(UpdateFailed):
-            await coordinator._async_update_data()
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
 
 
-async def test_coordinator_network_error(hass: HomeAssistant, coordinator):
+async def test_coordinator_network_error(
+    hass: HomeAssistant, coordinator, aioclient_mock: AiohttpClientMocker
+):
     """Test network error handling."""
-    with patch("custom_components.paris_markets.coordinator.requests.get") as mock_get:
-        mock_get.side_effect = requests.exceptions.RequestException("Network error")
+    aioclient_mock.get(API_ENDPOINT, exc=aiohttp.ClientError("Network error"))
 
-        with pytest.raises(UpdateFailed):
-            await coordinator._async_update_data()
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
 
 
-async def test_coordinator_no_location_configured(hass: HomeAssistant):
+async def test_coordinator_no_location_configured(
+    hass: HomeAssistant, radius_entry: ConfigEntry
+):
     """Test coordinator when Home Assistant location is not configured."""
 
     hass.config.latitude = None
     hass.config.longitude = None
 
-    entry = ConfigEntry(
-        version=1,
-        minor_version=1,
-        domain=DOMAIN,
-        title="Paris Markets",
-        data={
-            CONF_FILTER_MODE: FilterMode.RADIUS.value,
-            CONF_RADIUS: 5.0,
-            CONF_PRODUCT_TYPES: ["Alimentaire"],
-        },
-        source="user",
-        entry_id="test",
-        unique_id=None,
-        discovery_keys=MappingProxyType({}),
-        options={},
-        subentries_data=[],
-    )
-
-    coordinator = ParisMarketsDataUpdateCoordinator(hass, entry)
+    coordinator = ParisMarketsDataUpdateCoordinator(hass, radius_entry)
 
     with pytest.raises(UpdateFailed, match="Home Assistant location not configured"):
         await coordinator._async_update_data()
 
 
 async def test_coordinator_arrondissement_filtering(
-    hass: HomeAssistant, coordinator_arrondissement
+    hass: HomeAssistant,
+    coordinator_arrondissement,
+    aioclient_mock: AiohttpClientMocker,
 ):
     """Test successful data update with arrondissement filtering."""
-    mock_response_data = {
-        "results": [
-            {
-                "id_marche": "1",
-                "nom_long": "Test Market",
-                "nom_court": "test",
-                "ardt": 1,  # Integer arrondissement number
-                "localisation": "Test Location",
-                "produit": "Alimentaire",
-                "h_deb_sem_1": "08:00",
-                "h_fin_sem_1": "14:00",
-                "h_deb_sam": "08:00",
-                "h_fin_sam": "15:00",
-                "h_deb_dim": "",
-                "h_fin_dim": "",
-                "lundi": 0,
-                "mardi": 1,
-                "mercredi": 0,
-                "jeudi": 1,
-                "vendredi": 0,
-                "samedi": 1,
-                "dimanche": 0,
-                "geo_point_2d": {"lat": 48.8566, "lon": 2.3522},
-            }
-        ]
-    }
-
-    mock_response = MagicMock()
-    mock_response.json.return_value = mock_response_data
-    mock_response.raise_for_status.return_value = None
-
-    async def mock_executor_job(func, *args, **kwargs):
-        """Mock the async_add_executor_job to call function directly."""
-        return func(*args, **kwargs)
-
-    with (
-        patch.object(hass, "async_add_executor_job", side_effect=mock_executor_job),
-        patch(
-            "custom_components.paris_markets.coordinator.requests.get",
-            return_value=mock_response,
-        ),
-    ):
-        result = await coordinator_arrondissement._async_update_data()
+    aioclient_mock.get(API_ENDPOINT, json=_MARKET_RESPONSE)
 
-        assert len(result) == 1
-        assert "1" in result
-        assert result["1"]["long_name"] == "Test Market"
+    result = await coordinator_arrondissement._async_update_data()
 
+    assert len(result) == 1
+    assert "1" in result
+    assert result["1"].long_name == "Test Market"
 
-async def test_coordinator_data_normalisation(hass: HomeAssistant, coordinator):
-    """Test that data normalisation correctly converts field names and day values."""
-    # Test raw market data with French field names
-    raw_market_data = {
-        "id_marche": "123",
-        "nom_long": "Marché Saint-Germain",
-        "nom_court": "Saint-Germain",
-        "localisation": "Place Saint-Germain",
-        "ardt": "6",
-        "produit": "Alimentaire",
-        "jours_tenue": "Mardi, Samedi",
-        "gestionnaire": "Ville de Paris",
-        "secteur": "Test Sector",
-        "lineaire": "150",
-        "h_deb_sem_1": "08:00",
-        "h_fin_sem_1": "14:00",
-        "h_deb_sam": "08:00",
-        "h_fin_sam": "13:00",
-        "h_deb_dim": None,
-        "h_fin_dim": None,
-        "lundi": 0,  # Monday - closed
-        "mardi": 1,  # Tuesday - open
-        "mercredi": 0,  # Wednesday - closed
-        "jeudi": 0,  # Thursday - closed
-        "vendredi": 0,  # Friday - closed
-        "samedi": 1,  # Saturday - open
-        "dimanche": 0,  # Sunday - closed
-        "geo_point_2d": {"lat": 48.8566, "lon": 2.3522},
-    }
+    # Filters are combined into a single where clause
+    request_url = aioclient_mock.mock_calls[0][1]
+    assert request_url.query["where"] == (
+        'ardt IN (75001, 75002) AND produit IN ("Alimentaire")'
+    )
 
-    normalised = coordinator._normalise_market_data(raw_market_data)
 
+def _assert_fields_translated(normalised: dict) -> None:
+    """Check that French fields of _RAW_MARKET_DATA were translated."""
     # Check that field names are converted to English snake_case
     assert normalised["market_id"] == "123"
     assert normalised["long_name"] == "Marché Saint-Germain"
@@ -282,25 +344,6 @@ async def test_coordinator_data_normalisation(hass: HomeAssistant, coordinator):
     assert normalised["arrondissement"] == "6"
     assert normalised["product_type"] == "Alimentaire"
 
-    # Check that time fields are converted to structured schedule
-    paris_tz = pytz.timezone("Europe/Paris")
-    expected_schedule = {
-        1: None,  # Monday - closed (lundi: 0)
-        2: {
-            "start_time": time(8, 0, tzinfo=paris_tz),
-            "end_time": time(14, 0, tzinfo=paris_tz),
-        },  # Tuesday - open (mardi: 1)
-        3: None,  # Wednesday - closed (mercredi: 0)
-        4: None,  # Thursday - closed (jeudi: 0)
-        5: None,  # Friday - closed (vendredi: 0)
-        6: {
-            "start_time": time(8, 0, tzinfo=paris_tz),
-            "end_time": time(13, 0, tzinfo=paris_tz),
-        },  # Saturday - open (samedi: 1)
-        7: None,  # Sunday - closed (dimanche: 0)
-    }
-    assert normalised["schedule"] == expected_schedule
-
     # Check that old time field names are not present
     assert "weekday_start_time" not in normalised
     assert "h_deb_sem_1" not in normalised
@@ -323,105 +366,64 @@ async def test_coordinator_data_normalisation(hass: HomeAssistant, coordinator):
     assert "geo_point_2d" not in normalised
 
 
-async def test_coordinator_schedule_structure(hass: HomeAssistant, coordinator):
-    """Test that the schedule structure correctly maps day IDs to start/end times."""
-    # Test raw market data with all possible schedule configurations
-    raw_market_data = {
-        "id_marche": "456",
-        "nom_long": "Test Market",
-        "h_deb_sem_1": "09:00",  # Weekday start
-        "h_fin_sem_1": "15:00",  # Weekday end
-        "h_deb_sam": "08:30",  # Saturday start
-        "h_fin_sam": "12:30",  # Saturday end
-        "h_deb_dim": "10:00",  # Sunday start
-        "h_fin_dim": "13:00",  # Sunday end
-        "lundi": 1,
-        "mardi": 1,
-        "mercredi": 0,
-        "jeudi": 1,
-        "vendredi": 1,
-        "samedi": 1,
-        "dimanche": 1,
-    }
-
+@pytest.mark.parametrize(
+    ("raw_market_data", "expected_open_days", "extra_asserts"),
+    [
+        pytest.param(
+            _RAW_MARKET_DATA,
+            # Open on Tuesday (mardi: 1) and Saturday (samedi: 1)
+            {2: _WD_8_14, 6: _SAT_8_13},
+            _assert_fields_translated,
+            id="field_names",
+        ),
+        pytest.param(
+            _RAW_MARKET_DATA_ALL_SCHEDULES,
+            {
+                # Open weekdays share the weekday times, Wednesday is closed
+                1: _WD_9_15,
+                2: _WD_9_15,
+                4: _WD_9_15,
+                5: _WD_9_15,
+                # Saturday and Sunday use their own times
+                6: _SAT_830_1230,
+                7: _SUN_10_13,
+            },
+            None,
+            id="all_schedules",
+        ),
+        pytest.param(
+            _RAW_MARKET_DATA_PARTIAL,
+            # Open on Monday and Tuesday only
+            {1: _WD_8_14, 2: _WD_8_14},
+            None,
+            id="partial_schedule",
+        ),
+        pytest.param(
+            # Hours without a leading zero are accepted
+            MappingProxyType({**_RAW_MARKET_DATA_PARTIAL, "h_deb_sem_1": "8:00"}),
+            {1: _WD_8_14, 2: _WD_8_14},
+            None,
+            id="single_digit_hour",
+        ),
+    ],
+)
+def test_coordinator_normalise_market_data(
+    coordinator,
+    raw_market_data,
+    expected_open_days,
+    extra_asserts,
+):
+    """Test that raw market data is normalised into fields and a day ID schedule."""
     normalised = coordinator._normalise_market_data(raw_market_data)
-
-    # Check that schedule hash contains correct mappings
     schedule = normalised["schedule"]
 
-    # Open weekdays (Monday, Tuesday, Thursday, Friday) should have weekday times
-    paris_tz = pytz.timezone("Europe/Paris")
-    expected_weekday_schedule = {
-        "start_time": time(9, 0, tzinfo=paris_tz),
-        "end_time": time(15, 0, tzinfo=paris_tz),
-    }
-    assert schedule[1] == expected_weekday_schedule  # Monday (open)
-    assert schedule[2] == expected_weekday_schedule  # Tuesday (open)
-    assert schedule[4] == expected_weekday_schedule  # Thursday (open)
-    assert schedule[5] == expected_weekday_schedule  # Friday (open)
-
-    # Closed weekday (Wednesday) should be None
-    assert schedule[3] is None  # Wednesday (closed)
-
-    # Saturday should use Saturday times (open)
-    assert schedule[6] == {
-        "start_time": time(8, 30, tzinfo=paris_tz),
-        "end_time": time(12, 30, tzinfo=paris_tz),
-    }
-
-    # Sunday should use Sunday times (open)
-    assert schedule[7] == {
-        "start_time": time(10, 0, tzinfo=paris_tz),
-        "end_time": time(13, 0, tzinfo=paris_tz),
-    }
-
-    # Verify structure allows easy access by day ID
-    assert schedule[1]["start_time"] == time(9, 0, tzinfo=paris_tz)  # Monday start
-    assert schedule[1]["end_time"] == time(15, 0, tzinfo=paris_tz)  # Monday end
-    assert schedule[6]["start_time"] == time(8, 30, tzinfo=paris_tz)  # Saturday start
-    assert schedule[7]["end_time"] == time(13, 0, tzinfo=paris_tz)  # Sunday end
-
-
-async def test_coordinator_partial_schedule(hass: HomeAssistant, coordinator):
-    """Test schedule structure with missing time data."""
-    raw_market_data = {
-        "id_marche": "789",
-        "nom_long": "Partial Schedule Market",
-        "h_deb_sem_1": "08:00",  # Only weekday times
-        "h_fin_sem_1": "14:00",
-        # No Saturday or Sunday times
-        "lundi": 1,  # Monday - open
-        "mardi": 1,  # Tuesday - open
-        "mercredi": 0,  # Wednesday - closed
-        "jeudi": 0,  # Thursday - closed
-        "vendredi": 0,  # Friday - closed
-        "samedi": 0,  # Closed on Saturday
-        "dimanche": 0,  # Closed on Sunday
-    }
+    # All days should be present in schedule
+    assert schedule.keys() == _ALL_DAY_IDS
 
-    normalised = coordinator._normalise_market_data(raw_market_data)
-    schedule = normalised["schedule"]
+    # Open days carry their times, every other day is closed
+    assert {
+        day_id: day for day_id, day in schedule.items() if day is not None
+    } == expected_open_days
 
-    # All days should be present in schedule
-    for day_id in range(1, 8):
-        assert day_id in schedule
-
-    # Open weekdays should have times
-    paris_tz = pytz.timezone("Europe/Paris")
-    assert schedule[1] == {
-        "start_time": time(8, 0, tzinfo=paris_tz),
-        "end_time": time(14, 0, tzinfo=paris_tz),
-    }  # Monday - open
-    assert schedule[2] == {
-        "start_time": time(8, 0, tzinfo=paris_tz),
-        "end_time": time(14, 0, tzinfo=paris_tz),
-    }  # Tuesday - open
-
-    # Closed weekdays should be None
-    assert schedule[3] is None  # Wednesday - closed
-    assert schedule[4] is None  # Thursday - closed
-    assert schedule[5] is None  # Friday - closed
-
-    # Closed Saturday and Sunday should be None
-    assert schedule[6] is None  # Saturday - closed
-    assert schedule[7] is None  # Sunday - closed
+    if extra_asserts is not None:
+        extra_asserts(normalised)